@@ -8,53 +8,175 @@ FastAPI server providing:
 """
 
 import asyncio
-import json
+import hashlib
 import logging
+import mimetypes
+import os
 import shutil
 import subprocess
 import tempfile
+import orjson
 import websockets
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from itertools import count, groupby
+from operator import itemgetter
 from pathlib import Path
 from typing import Annotated
 
 from fastapi import Depends, FastAPI, File, UploadFile, WebSocket, WebSocketDisconnect
+from fastapi.requests import HTTPConnection
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import NotModifiedResponse
+from starlette.types import Scope
+from starlette.websockets import WebSocketState
 from google import genai
 from google.genai import types as genai_types
 
 import slidekick.config as config
 from slidekick import AudioProcessor, SlideTools, StateManager, ToolExecutor
 from slidekick.content_processor import ContentProcessor
+from slidekick.exceptions import SessionClosedError, is_connection_closed
 
 logger = logging.getLogger(__name__)
 
 # Store latest summary in memory (for hackathon demo simplicity)
 LATEST_SLIDE_SUMMARY = None
 
+# Outbound WebSocket coalescing: messages queued within this window are flushed
+# together, or sooner once this many bytes are buffered (also the audio frame cap)
+SEND_BATCH_WINDOW = 0.005  # seconds
+SEND_BATCH_MAX_BYTES = 64 * 1024
+
+# Bursts of slide_sync messages (e.g. fragment transitions) are debounced to the latest one
+SLIDE_SYNC_DEBOUNCE = 0.02  # seconds
+
+# slide_command messages have a fixed shape, so they are formatted from a
+# pre-serialized template; fields outside these sets fall back to orjson
+SLIDE_COMMAND_TEMPLATE = '{"type":"slide_command","action":"%s","slide_index":%d,"status":"%s"}'
+SLIDE_COMMAND_ACTIONS = frozenset({"next", "prev", "jump"})
+TOOL_STATUSES = frozenset({"success", "error", "unknown"})
+
+# reveal-md invocation, resolved once at startup (see resolve_reveal_md_command)
+REVEAL_MD_COMMAND = ["npx", "-y", "reveal-md"]
+
+# Concurrent reveal-md renders are capped at one Node process per CPU
+REVEAL_MD_SLOTS = asyncio.Semaphore(os.cpu_count() or 1)
+
+# Rendered decks keyed by BLAKE2b digest of the uploaded markdown, so re-uploading
+# an identical file skips both reveal-md and the summary call
+DECK_CACHE: dict[str, dict[str, str | None]] = {}
+
+# Uploads are streamed to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Audio backlogged behind a slow Gemini uplink is sent in one message of up to
+# ~160 ms (16 kHz, 16-bit mono) instead of chunk by chunk
+AUDIO_BATCH_MAX_BYTES = 5120
+
+# Monotonic WebSocket session ids (tagged onto log records via config.SESSION_ID)
+SESSION_IDS = count(1)
+
+# WebSocket audio processors are pooled; the pool size also caps concurrent sessions
+AUDIO_POOL_SIZE = min((os.cpu_count() or 1) * 2, 32)
+AUDIO_POOL_TIMEOUT = 1.0  # seconds to wait for a free processor before rejecting
+
+# Audio waiting for the Gemini uplink is capped by duration as well as by chunk
+# count, so latency stays bounded whatever frame size the browser sends
+AUDIO_MAX_BUFFER_SECONDS = 0.8
+
 
 # =============================================================================
 # Application Setup
 # =============================================================================
 
 
+def resolve_reveal_md_command() -> list[str]:
+    """
+    Locate the reveal-md executable so uploads don't pay npx package resolution.
+
+    Prefers the project-local install (`npm install`), then a global one on PATH,
+    and falls back to `npx` when neither is available.
+    """
+    local_bin = config.BASE_DIR / "node_modules" / ".bin" / "reveal-md"
+    if local_bin.exists():
+        return [str(local_bin)]
+    if global_bin := shutil.which("reveal-md"):
+        return [global_bin]
+    return ["npx", "-y", "reveal-md"]
+
+
+def reset_thread_scheduling() -> None:
+    """Drop a worker thread back to SCHED_OTHER (threads inherit SCHED_FIFO)."""
+    os.sched_setscheduler(0, os.SCHED_OTHER, os.sched_param(0))
+
+
+def apply_scheduling() -> None:
+    """
+    Apply the optional CPU pinning and real-time priority from config.
+
+    With ENABLE_RT the event loop thread runs under SCHED_FIFO so background work
+    cannot preempt audio forwarding; blocking work handed to `asyncio.to_thread`
+    runs on an executor whose threads are reset to SCHED_OTHER.
+    """
+    if config.CPU_AFFINITY and hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, config.CPU_AFFINITY)
+            logger.info("Pinned to CPUs %s", sorted(config.CPU_AFFINITY))
+        except OSError as e:
+            logger.warning("Could not set CPU affinity: %s", e)
+
+    if config.ENABLE_RT and hasattr(os, "SCHED_FIFO"):
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(config.RT_PRIORITY))
+        except OSError as e:
+            logger.warning("Could not enable SCHED_FIFO (needs CAP_SYS_NICE): %s", e)
+            return
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(initializer=reset_thread_scheduling)
+        )
+        logger.info("Event loop running under SCHED_FIFO (priority %s)", config.RT_PRIORITY)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan event handler for startup/shutdown."""
+    global REVEAL_MD_COMMAND
     logger.info("Starting Slidekick server")
 
     config.SLIDES_DIR.mkdir(parents=True, exist_ok=True)
+    apply_scheduling()
+
+    REVEAL_MD_COMMAND = resolve_reveal_md_command()
+    logger.info("Using reveal-md: %s", " ".join(REVEAL_MD_COMMAND))
+
+    # One Gemini client for all sessions, so connection setup is paid once
+    app.state.gemini_client = genai.Client(api_key=config.GEMINI_API_KEY)
+    app.state.content_processor = ContentProcessor(client=app.state.gemini_client)
+
+    app.state.audio_pool = asyncio.Queue()
+    for _ in range(AUDIO_POOL_SIZE):
+        app.state.audio_pool.put_nowait(AudioProcessor.from_websocket(
+            max_buffer_seconds=AUDIO_MAX_BUFFER_SECONDS,
+            silence_hangover_seconds=config.SILENCE_HANGOVER_SECONDS or None,
+        ))
 
     yield
 
-    # Cleanup on shutdown
+    await app.state.gemini_client.aio.aclose()
+    app.state.gemini_client.close()
+
+    # Cleanup on shutdown, removing decks in parallel off the event loop
     logger.info("Cleaning up temporary directories")
-    for file in config.SLIDES_DIR.glob("reveal-md-*"):
-        if file.is_dir():
-            shutil.rmtree(file)
-        else:
-            file.unlink()
+    await asyncio.gather(*(
+        asyncio.to_thread(shutil.rmtree, file, ignore_errors=True)
+        if file.is_dir()
+        else asyncio.to_thread(file.unlink, missing_ok=True)
+        for file in config.SLIDES_DIR.glob("reveal-md-*")
+    ))
 
 
 app = FastAPI(lifespan=lifespan, title="Agentic Slide Deck API")
@@ -67,8 +189,119 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+
+class SlideStaticFiles(StaticFiles):
+    """
+    StaticFiles that serves each deck's `mermaid/` assets from memory.
+
+    Every rendered deck links the same node_modules/mermaid bundle, which never
+    changes while the server runs, so its files are read once and kept as bytes
+    with a precomputed ETag instead of hitting the filesystem on every fetch.
+    In production, put nginx in front of `/slides` instead (see README).
+    """
+
+    def __init__(self, *, mermaid_dir: Path, **kwargs):
+        super().__init__(**kwargs)
+        self.mermaid_dir = mermaid_dir.resolve()
+        self._mermaid_cache: dict[str, tuple[bytes, dict[str, str]]] = {}
+
+    def _load_mermaid_asset(self, asset: str) -> tuple[bytes, dict[str, str]] | None:
+        """Read a mermaid file and build its response headers, or None if missing."""
+        full_path = (self.mermaid_dir / asset).resolve()
+        if not full_path.is_relative_to(self.mermaid_dir) or not full_path.is_file():
+            return None
+        body = full_path.read_bytes()
+        media_type = mimetypes.guess_type(full_path.name)[0] or "application/octet-stream"
+        headers = {
+            "content-type": media_type,
+            "content-length": str(len(body)),
+            "etag": f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+        }
+        return body, headers
+
+    def _is_deck(self, name: str) -> bool:
+        """Return True if name is a rendered deck directory under the slides root."""
+        return name not in (os.curdir, os.pardir) and os.path.isdir(os.path.join(self.directory, name))
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        parts = Path(path).parts
+        if (
+            scope["method"] in ("GET", "HEAD")
+            and len(parts) > 2
+            and parts[1] == "mermaid"
+            and self._is_deck(parts[0])
+        ):
+            asset = os.path.join(*parts[2:])
+            cached = self._mermaid_cache.get(asset)
+            if cached is None:
+                cached = await asyncio.to_thread(self._load_mermaid_asset, asset)
+                if cached is not None:
+                    self._mermaid_cache[asset] = cached
+            if cached is not None:
+                body, headers = cached
+                if self.is_not_modified(Headers(headers), Headers(scope=scope)):
+                    return NotModifiedResponse(Headers(headers))
+                return Response(body, headers=headers)
+        return await super().get_response(path, scope)
+
+
 # Mount static files for the generated slides
-app.mount("/slides", StaticFiles(directory=config.SLIDES_DIR, html=True), name="slides")
+app.mount(
+    "/slides",
+    SlideStaticFiles(
+        directory=config.SLIDES_DIR,
+        html=True,
+        mermaid_dir=config.BASE_DIR / "node_modules" / "mermaid",
+    ),
+    name="slides",
+)
+
+
+# =============================================================================
+# Tool Declarations
+# =============================================================================
+
+# Declarations are identical for every session, so they are built once here
+NAVIGATE_SLIDE_DECLARATION = genai_types.FunctionDeclaration(
+    name="navigate_slide",
+    description="Move to next/prev slide or jump to specific slide number.",
+    parameters=genai_types.Schema(
+        type=genai_types.Type.OBJECT,
+        properties={
+            "direction": genai_types.Schema(
+                type=genai_types.Type.STRING,
+                enum=["next", "prev", "jump"],
+                description="Navigation direction: 'next', 'prev', or 'jump'",
+            ),
+            "index": genai_types.Schema(
+                type=genai_types.Type.INTEGER,
+                description="Target slide number (1-based). Required for 'jump'.",
+            ),
+        },
+        required=["direction"],
+    ),
+)
+
+TRIGGER_SUMMARY_DECLARATION = genai_types.FunctionDeclaration(
+    name="trigger_summary",
+    description="Trigger the background generation of a presentation summary.",
+    parameters=genai_types.Schema(
+        type=genai_types.Type.OBJECT,
+        properties={
+            "conversational_context": genai_types.Schema(
+                type=genai_types.Type.STRING,
+                description="A detailed summary of what the SPEAKER has said during the presentation so far. Be comprehensive.",
+            ),
+        },
+        required=["conversational_context"],
+    ),
+)
+
+# Live configs keyed by (declaration ids, slide summary). The ids are stable because
+# the declarations above live for the whole process
+GEMINI_CONFIG_CACHE: dict[tuple[tuple[int, ...], str | None], genai_types.LiveConnectConfig] = {}
+GEMINI_CONFIG_CACHE_SIZE = 8
 
 
 # =============================================================================
@@ -76,9 +309,14 @@ app.mount("/slides", StaticFiles(directory=config.SLIDES_DIR, html=True), name="
 # =============================================================================
 
 
-def create_gemini_client() -> genai.Client:
-    """Create a Gemini client."""
-    return genai.Client(api_key=config.GEMINI_API_KEY)
+def get_gemini_client(connection: HTTPConnection) -> genai.Client:
+    """Return the shared Gemini client created at startup."""
+    return connection.app.state.gemini_client
+
+
+def get_content_processor(connection: HTTPConnection) -> ContentProcessor:
+    """Return the shared slide/summary processor created at startup."""
+    return connection.app.state.content_processor
 
 
 def create_session_components() -> tuple[ToolExecutor, StateManager, SlideTools]:
@@ -101,67 +339,43 @@ def create_session_components() -> tuple[ToolExecutor, StateManager, SlideTools]
             return await tools.navigate_slide(direction, backend_index)
         return await tools.navigate_slide(direction, index)
 
-    # Register navigation tool
-    executor.register_tool(
-        "navigate_slide",
-        navigate_slide_wrapper,
-        genai_types.FunctionDeclaration(
-            name="navigate_slide",
-            description="Move to next/prev slide or jump to specific slide number.",
-            parameters=genai_types.Schema(
-                type=genai_types.Type.OBJECT,
-                properties={
-                    "direction": genai_types.Schema(
-                        type=genai_types.Type.STRING,
-                        enum=["next", "prev", "jump"],
-                        description="Navigation direction: 'next', 'prev', or 'jump'",
-                    ),
-                    "index": genai_types.Schema(
-                        type=genai_types.Type.INTEGER,
-                        description="Target slide number (1-based). Required for 'jump'.",
-                    ),
-                },
-                required=["direction"],
-            ),
-        ),
-    )
-
-    # Register trigger_summary tool
-    executor.register_tool(
-        "trigger_summary",
-        tools.trigger_summary,
-        genai_types.FunctionDeclaration(
-            name="trigger_summary",
-            description="Trigger the background generation of a presentation summary.",
-            parameters=genai_types.Schema(
-                type=genai_types.Type.OBJECT,
-                properties={
-                    "conversational_context": genai_types.Schema(
-                        type=genai_types.Type.STRING,
-                        description="A detailed summary of what the SPEAKER has said during the presentation so far. Be comprehensive.",
-                    ),
-                },
-                required=["conversational_context"],
-            ),
-        ),
-    )
+    executor.register_tool("navigate_slide", navigate_slide_wrapper, NAVIGATE_SLIDE_DECLARATION)
+    executor.register_tool("trigger_summary", tools.trigger_summary, TRIGGER_SUMMARY_DECLARATION)
 
     return executor, state, tools
 
 
 def create_gemini_config(executor: ToolExecutor, slide_summary: str | None = None) -> genai_types.LiveConnectConfig:
-    """Create Gemini Live API configuration with tools."""
-    
-    system_instruction = config.GEMINI_LIVE_SYSTEM_INSTRUCTION
+    """
+    Create Gemini Live API configuration with tools.
+
+    Sessions with the same tools and slide summary share one cached config, and
+    configs with a summary are shallow copies of the summary-less base config, so
+    the tool declarations are shared rather than rebuilt.
+    """
+    declarations = executor.tools
+    key = (tuple(id(declaration) for declaration in declarations), slide_summary)
+    if (cached := GEMINI_CONFIG_CACHE.get(key)) is not None:
+        return cached
+
     if slide_summary:
-        system_instruction += f"\n\nCONTEXT: Slide Summary\n{slide_summary}"
+        base_config = create_gemini_config(executor)
+        gemini_config = base_config.model_copy(update={
+            "system_instruction": f"{base_config.system_instruction}\n\nCONTEXT: Slide Summary\n{slide_summary}",
+        })
         logger.info("Injected slide summary into system instruction")
-        
-    return genai_types.LiveConnectConfig(
-        response_modalities=["AUDIO"],
-        tools=[genai_types.Tool(function_declarations=executor.tools)],
-        system_instruction=system_instruction,
-    )
+    else:
+        gemini_config = genai_types.LiveConnectConfig(
+            response_modalities=["AUDIO"],
+            tools=[genai_types.Tool(function_declarations=declarations)],
+            system_instruction=config.GEMINI_LIVE_SYSTEM_INSTRUCTION,
+        )
+
+    # Evict the oldest entry; summaries only change when a new deck is uploaded
+    if len(GEMINI_CONFIG_CACHE) >= GEMINI_CONFIG_CACHE_SIZE:
+        del GEMINI_CONFIG_CACHE[next(iter(GEMINI_CONFIG_CACHE))]
+    GEMINI_CONFIG_CACHE[key] = gemini_config
+    return gemini_config
 
 
 # =============================================================================
@@ -175,16 +389,99 @@ async def health_check():
     return {"status": "ok"}
 
 
+async def run_reveal_md(file_path: Path, output_dir: str) -> tuple[str, str]:
+    """
+    Render a markdown deck to a static Reveal.js site without blocking the event loop.
+
+    Renders queue for a free slot in REVEAL_MD_SLOTS so concurrent uploads can't
+    oversubscribe the CPU with Node processes.
+
+    Returns:
+        Tuple of (stdout, stderr)
+
+    Raises:
+        subprocess.CalledProcessError: If reveal-md exits with a non-zero status
+    """
+    command = [*REVEAL_MD_COMMAND, str(file_path), "--static", output_dir]
+    async with REVEAL_MD_SLOTS:
+        proc = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await proc.communicate()
+    stdout, stderr = stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, command, stdout, stderr)
+
+    return stdout, stderr
+
+
+async def save_upload(file: UploadFile, file_path: Path) -> str:
+    """
+    Stream an uploaded file to disk without blocking the event loop.
+
+    Returns:
+        Hex digest of the file contents (used as the DECK_CACHE key)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "wb") as buffer:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+            await asyncio.to_thread(buffer.write, chunk)
+    return digest.hexdigest()
+
+
+def record_summary(digest: str, summary: str | BaseException) -> None:
+    """
+    Publish a deck's summary for new sessions and cache it if it succeeded.
+
+    A failed summary doesn't fail the upload; it clears LATEST_SLIDE_SUMMARY
+    so sessions don't get a previous deck's summary.
+    """
+    global LATEST_SLIDE_SUMMARY
+    if isinstance(summary, BaseException):
+        logger.error("Summary generation failed: %s", summary)
+        LATEST_SLIDE_SUMMARY = None
+        return
+
+    # Store in global variable for new sessions
+    LATEST_SLIDE_SUMMARY = summary
+    if not summary.startswith("Error"):
+        DECK_CACHE[digest]["summary"] = summary
+    logger.info("Slide summary generated (%s chars)", len(summary))
+
+
 @app.post("/upload")
-async def upload_slides(file: UploadFile = File(...)):
+async def upload_slides(
+    processor: Annotated[ContentProcessor, Depends(get_content_processor)],
+    file: UploadFile = File(...),
+):
     """Upload and convert markdown slides to Reveal.js format."""
+    global LATEST_SLIDE_SUMMARY
     try:
         file_path = config.UPLOADS_DIR / file.filename
 
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        digest = await save_upload(file, file_path)
 
-        logger.info(f"Saved {file.filename}, size: {file_path.stat().st_size} bytes")
+        logger.info("Saved %s, size: %s bytes", file.filename, file_path.stat().st_size)
+
+        # Reuse the previous render (and summary) of an identical deck
+        cached = DECK_CACHE.get(digest)
+        if cached and Path(cached["output_dir"]).is_dir():
+            relative_path = Path(cached["output_dir"]).name
+            logger.info("Deck unchanged, reusing conversion: %s", relative_path)
+            if cached["summary"]:
+                LATEST_SLIDE_SUMMARY = cached["summary"]
+            else:
+                # The earlier summary failed; retry it rather than keep another deck's
+                try:
+                    summary = await processor.process_slides(file_path)
+                except Exception as e:
+                    summary = e
+                record_summary(digest, summary)
+            return {"status": "success", "url": f"/slides/{relative_path}/index.html"}
 
         # Create temp directory for reveal-md output
         if config.USE_TEMP_DIR:
@@ -194,9 +491,16 @@ async def upload_slides(file: UploadFile = File(...)):
             # Create a temporary directory in the slides directory (mostly for debugging purposes)
             temp_dir = tempfile.mkdtemp(dir=config.SLIDES_DIR, prefix="reveal-md-")
 
-        # Run reveal-md to generate static site
-        command = ["npx", "-y", "reveal-md", str(file_path), "--static", temp_dir]
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
+        # Render the deck and summarize it concurrently; both read the original markdown
+        logger.info("Converting slides and processing them for AI summary...")
+        render_result, summary = await asyncio.gather(
+            run_reveal_md(file_path, temp_dir),
+            processor.process_slides(file_path),
+            return_exceptions=True,
+        )
+        if isinstance(render_result, BaseException):
+            raise render_result
+        stdout, stderr = render_result
 
         # Create symbolic link to mermaid in static slides
         mermaid_src = config.BASE_DIR / "node_modules" / "mermaid"
@@ -208,34 +512,25 @@ async def upload_slides(file: UploadFile = File(...)):
         elif not mermaid_src.exists():
             logger.warning("mermaid node_module not found, skipping symlink")
 
-        logger.debug(f"reveal-md stdout: \n{result.stdout}")
-        if result.stderr:
-            logger.debug(f"reveal-md stderr: \n{result.stderr}")
+        # reveal-md output can be large; skip it entirely unless DEBUG is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("reveal-md stdout: \n%s", stdout)
+            if stderr:
+                logger.debug("reveal-md stderr: \n%s", stderr)
 
         relative_path = Path(temp_dir).name
-        logger.info(f"Conversion complete: {relative_path}")
-        
-        # Generate AI summary of slides
-        logger.info("Processing slides for AI summary...")
-        try:
-            processor = ContentProcessor()
-            # Use the original markdown file for summary generation
-            summary = await processor.process_slides(file_path) 
-            
-            # Store in global variable for new sessions
-            global LATEST_SLIDE_SUMMARY
-            LATEST_SLIDE_SUMMARY = summary
-            logger.info(f"Slide summary generated ({len(summary)} chars)")
-        except Exception as e:
-            logger.error(f"Summary generation failed: {e}")
-        
+        logger.info("Conversion complete: %s", relative_path)
+        DECK_CACHE[digest] = {"output_dir": temp_dir, "summary": None}
+
+        record_summary(digest, summary)
+
         return {"status": "success", "url": f"/slides/{relative_path}/index.html"}
 
     except subprocess.CalledProcessError as e:
-        logger.error(f"reveal-md failed: {e.stderr}")
+        logger.error("reveal-md failed: %s", e.stderr)
         return {"status": "error", "message": f"Conversion failed: {e.stderr}"}
     except Exception as e:
-        logger.exception(f"Upload failed: {e}")
+        logger.exception("Upload failed: %s", e)
         return {"status": "error", "message": str(e)}
 
 
@@ -247,235 +542,288 @@ async def upload_slides(file: UploadFile = File(...)):
 @app.websocket("/ws")
 async def websocket_endpoint(
     websocket: WebSocket,
-    client: Annotated[genai.Client, Depends(create_gemini_client)],
+    client: Annotated[genai.Client, Depends(get_gemini_client)],
+    content_processor: Annotated[ContentProcessor, Depends(get_content_processor)],
 ):
     """WebSocket endpoint for real-time voice control and slide navigation."""
     await websocket.accept()
-    session_id = id(websocket)
+    session_id = next(SESSION_IDS)
+    config.SESSION_ID.set(session_id)
 
-    logger.info("WebSocket connected", extra={"session_id": session_id})
+    logger.info("WebSocket connected")
 
-    # Create session-scoped components
-    executor, state_manager, slide_tools = create_session_components()
-    await state_manager.set_session_id(session_id)
-    
-    # Inject latest summary if available
-    gemini_config = create_gemini_config(executor, slide_summary=LATEST_SLIDE_SUMMARY)
-
-    # Create audio processor for WebSocket audio
-    audio_processor = AudioProcessor.from_websocket()
-    await audio_processor.start()
+    # Check out an audio processor, turning the client away if all are in use
+    audio_pool: asyncio.Queue = websocket.app.state.audio_pool
+    try:
+        audio_processor = await asyncio.wait_for(audio_pool.get(), timeout=AUDIO_POOL_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning("No audio processor available, rejecting session")
+        await websocket.close(code=1013, reason="Server busy, try again later")
+        return
 
     # Shared state
-    is_connected = True
+    outbound_queue: asyncio.Queue[tuple[str, str | bytes]] = asyncio.Queue()
+    outbound_bytes = 0
+    outbound_full = asyncio.Event()
     allow_interruption = asyncio.Event()
     allow_interruption.set()
+    pending_slide: int | None = None
+    slide_synced = asyncio.Event()
+    summary_task: asyncio.Task | None = None
 
     # -------------------------------------------------------------------------
     # Helper Functions
     # -------------------------------------------------------------------------
 
+    def enqueue_outbound(kind: str, payload: str | bytes):
+        """Queue a payload, waking `send_outbound` early once the buffer is full."""
+        nonlocal outbound_bytes
+        outbound_queue.put_nowait((kind, payload))
+        outbound_bytes += len(payload)
+        if outbound_bytes >= SEND_BATCH_MAX_BYTES:
+            outbound_full.set()
+
     async def safe_send_json(data: dict):
-        """Safely send JSON to the WebSocket client."""
-        nonlocal is_connected
-        if not is_connected:
-            return
-        try:
-            await websocket.send_json(data)
-            logger.debug(f"Sent: {data.get('type', 'unknown')}", extra={"session_id": session_id})
-        except Exception as e:
-            logger.warning(f"Send failed: {e}", extra={"session_id": session_id})
-            is_connected = False
+        """Serialize and queue JSON for the WebSocket client (flushed by `send_outbound`)."""
+        if websocket.client_state is WebSocketState.CONNECTED:
+            enqueue_outbound("json", orjson.dumps(data).decode())
+
+    async def send_slide_command(action: str, slide_index: int, status: str):
+        """Queue a slide_command message, skipping JSON encoding for known fields."""
+        if action not in SLIDE_COMMAND_ACTIONS or status not in TOOL_STATUSES:
+            await safe_send_json({
+                "type": "slide_command",
+                "action": action,
+                "slide_index": slide_index,
+                "status": status,
+            })
+        elif websocket.client_state is WebSocketState.CONNECTED:
+            enqueue_outbound("json", SLIDE_COMMAND_TEMPLATE % (action, slide_index, status))
 
     async def safe_send_bytes(data: bytes):
-        """Safely send bytes to the WebSocket client."""
-        nonlocal is_connected
-        if not is_connected:
-            return
+        """Queue bytes for the WebSocket client (flushed by `send_outbound`)."""
+        if websocket.client_state is WebSocketState.CONNECTED:
+            enqueue_outbound("bytes", data)
+
+    async def flush_outbound(pending: list[tuple[str, str | bytes]]):
+        """Send queued messages, coalescing consecutive runs of the same kind."""
+        for kind, group in groupby(pending, key=itemgetter(0)):
+            payloads = [payload for _, payload in group]
+
+            if kind == "json":
+                # Payloads are already serialized, so a batch is spliced rather than re-encoded
+                if len(payloads) == 1:
+                    await websocket.send_text(payloads[0])
+                else:
+                    await websocket.send_text('{"type":"batch","messages":[' + ",".join(payloads) + "]}")
+                continue
+
+            # Join audio into as few binary frames as the size cap allows
+            frame: list[bytes] = []
+            frame_size = 0
+            for chunk in payloads:
+                if frame and frame_size + len(chunk) > SEND_BATCH_MAX_BYTES:
+                    await websocket.send_bytes(b"".join(frame))
+                    frame, frame_size = [], 0
+                frame.append(chunk)
+                frame_size += len(chunk)
+            await websocket.send_bytes(b"".join(frame))
+
+    async def send_outbound():
+        """Drain the outbound queue, batching messages that arrive close together."""
+        nonlocal outbound_bytes
         try:
-            await websocket.send_bytes(data)
+            while True:
+                first = await outbound_queue.get()
+
+                # Give the burst a moment to accumulate (unless the buffer is already
+                # full), then take everything queued
+                try:
+                    await asyncio.wait_for(outbound_full.wait(), timeout=SEND_BATCH_WINDOW)
+                except asyncio.TimeoutError:
+                    pass
+                pending = [first]
+                while not outbound_queue.empty():
+                    pending.append(outbound_queue.get_nowait())
+                outbound_bytes = 0
+                outbound_full.clear()
+
+                await flush_outbound(pending)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Sent %s message(s)", len(pending))
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            logger.warning(f"Send bytes failed: {e}", extra={"session_id": session_id})
-            is_connected = False
+            logger.warning("Send failed: %s", e)
+            raise SessionClosedError("WebSocket send failed", e) from e
 
     async def handle_frontend_message(message: dict):
         """Handle JSON messages from the frontend."""
+        nonlocal pending_slide
         msg_type = message.get("type")
         
         if msg_type == "slide_info":
             # Frontend reporting slide count
             total = message.get("total_slides", 0)
             current = message.get("current_slide", 0)
+            pending_slide = None
             await state_manager.set_total_slides(total)
             await state_manager.set_current_slide(current)
-            logger.info(f"Slide info: {current + 1}/{total}", extra={"session_id": session_id})
+            logger.info("Slide info: %s/%s", current + 1, total)
             
         elif msg_type == "slide_sync":
-            # Frontend syncing current slide position
-            current = message.get("current_slide", 0)
-            await state_manager.set_current_slide(current)
-            logger.debug(f"Slide synced: {current + 1}", extra={"session_id": session_id})
+            # Frontend syncing current slide position (applied by `apply_slide_sync`)
+            pending_slide = message.get("current_slide", 0)
+            slide_synced.set()
             
         elif msg_type == "request_summary":
             # Manual summary request from frontend
-            logger.info("Manual summary requested", extra={"session_id": session_id})
+            logger.info("Manual summary requested")
             await safe_send_json({"type": "status", "message": "Generating summary..."})
-            asyncio.create_task(run_background_summary(""))
+            start_background_summary("")
             
         else:
-            logger.debug(f"Unknown message type: {msg_type}", extra={"session_id": session_id})
+            logger.debug("Unknown message type: %s", msg_type)
 
     # -------------------------------------------------------------------------
     # WebSocket Tasks
     # -------------------------------------------------------------------------
 
+    async def apply_slide_sync():
+        """Apply the latest slide_sync position once a burst has settled."""
+        nonlocal pending_slide
+        while True:
+            await slide_synced.wait()
+            await asyncio.sleep(SLIDE_SYNC_DEBOUNCE)
+            slide_synced.clear()
+
+            current, pending_slide = pending_slide, None
+            if current is not None:
+                await state_manager.set_current_slide(current)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Slide synced: %s", current + 1)
+
     async def receive_websocket_data():
         """Receive data from WebSocket - handles both audio and JSON messages."""
-        nonlocal is_connected
         try:
-            while is_connected:
+            while True:
                 message = await websocket.receive()
-                
-                if message["type"] != "websocket.receive":
-                    continue
 
-                if "bytes" in message:
+                if (chunk := message.get("bytes")) is not None:
                     # Audio data
-                    await audio_processor.push_audio(message["bytes"])
-                elif "text" in message:
+                    await audio_processor.push_audio(chunk)
+                elif (text := message.get("text")) is not None:
                     # JSON message from frontend
                     try:
-                        data = json.loads(message["text"])
+                        data = orjson.loads(text)
                         await handle_frontend_message(data)
-                    except json.JSONDecodeError:
-                        logger.warning("Invalid JSON received", extra={"session_id": session_id})
-                            
-        except WebSocketDisconnect:
-            logger.info("WebSocket disconnected", extra={"session_id": session_id})
-            is_connected = False
-        except RuntimeError as e:
-            if "Cannot call \"receive\" once a disconnect message has been received" in str(e):
-                logger.info("WebSocket connection closed during receive", extra={"session_id": session_id})
-                is_connected = False
-            else:
-                logger.exception(f"RuntimeError receiving data: {e}", extra={"session_id": session_id})
-                is_connected = False
-        except asyncio.CancelledError:
+                    except orjson.JSONDecodeError:
+                        logger.warning("Invalid JSON received")
+                elif message["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+
+        except (WebSocketDisconnect, asyncio.CancelledError):
             raise
         except Exception as e:
-            logger.exception(f"Error receiving data: {e}", extra={"session_id": session_id})
-            is_connected = False
+            logger.exception("Error receiving data: %s", e)
+            raise SessionClosedError("WebSocket receive failed", e) from e
 
     async def forward_audio_to_gemini(session):
         """Forward audio from processor queue to Gemini session."""
-        nonlocal is_connected
         try:
-            while is_connected:
+            # Runs until the TaskGroup cancels it at session end
+            while True:
+                audio_msg = await audio_processor.get_audio_batch(AUDIO_BATCH_MAX_BYTES)
+
                 # Wait if interruption is not allowed (e.g. during tool execution)
                 if not allow_interruption.is_set():
-                     logger.debug("Audio forwarding paused (Gate Closed)", extra={"session_id": session_id})
-                await allow_interruption.wait()
+                    logger.debug("Audio forwarding paused (Gate Closed)")
+                    await allow_interruption.wait()
 
-                try:
-                    audio_msg = await asyncio.wait_for(
-                        audio_processor.get_audio(),
-                        timeout=1.0,
-                    )
-                    await session.send_realtime_input(audio=audio_msg)
-                except asyncio.TimeoutError:
-                    continue
+                await session.send_realtime_input(audio=audio_msg)
         except asyncio.CancelledError:
             raise
         except Exception as e:
-            error_str = str(e).lower()
-            if "1011" in error_str or "closed" in error_str or "1008" in error_str:
-                logger.info(f"Gemini connection closed: {e}", extra={"session_id": session_id})
+            if is_connection_closed(e):
+                logger.info("Gemini connection closed: %s", e)
             else:
-                logger.exception(f"Audio forward error: {e}", extra={"session_id": session_id})
-            is_connected = False
+                logger.exception("Audio forward error: %s", e)
+            raise SessionClosedError("Audio forwarding failed", e) from e
 
     async def handle_gemini_responses(session):
         """Handle responses from Gemini: audio, text, and tool calls."""
-        nonlocal is_connected
 
         try:
-            while is_connected:
+            while True:
                 try:
                     turn = session.receive()
 
                     async for response in turn:
-                        if not is_connected:
-                            break
-
-                        # Handle tool calls
-                        if hasattr(response, "tool_call") and response.tool_call:
-                            await process_tool_calls(response.tool_call)
+                        # Handle tool calls (LiveServerMessage fields always exist, may be None)
+                        if tool_call := response.tool_call:
+                            await process_tool_calls(tool_call)
 
                         # NOTE: Audio forwarding disabled - Gemini voice confirmations were distracting
                         # We keep response_modalities=["AUDIO"] to avoid WebSocket errors,
                         # but don't send the audio to the frontend
-                        # if hasattr(response, "data") and response.data:
+                        # if response.data:
                         #     await safe_send_bytes(response.data)
 
                         # Log text responses and capture transcript
-                        if response.server_content and response.server_content.model_turn:
-                            for part in response.server_content.model_turn.parts:
-                                if hasattr(part, "text") and part.text:
-                                    text = part.text.strip()
-                                    if text:
-                                        logger.info(f"Gemini: {text[:100]}...", extra={"session_id": session_id})
-                                        # Buffer transcript for summary generation
-                                        await state_manager.add_transcript(text)
-                                        
-                                        await safe_send_json({
-                                            "type": "transcript",
-                                            "text": text,
-                                        })
+                        if (server_content := response.server_content) and (
+                            model_turn := server_content.model_turn
+                        ):
+                            for part in model_turn.parts or ():
+                                if (text := part.text) and (text := text.strip()):
+                                    if logger.isEnabledFor(logging.INFO):
+                                        logger.info("Gemini: %s...", text[:100])
+                                    # Buffer transcript for summary generation
+                                    await state_manager.add_transcript(text)
+
+                                    await safe_send_json({
+                                        "type": "transcript",
+                                        "text": text,
+                                    })
 
                 except asyncio.CancelledError:
                     raise
                 except Exception as e:
-                    error_str = str(e).lower()
-                    if "1011" in error_str or "closed" in error_str or "1008" in error_str:
-                        logger.warning(f"Connection closed (likely interruption): {e}", extra={"session_id": session_id})
+                    if is_connection_closed(e):
+                        logger.warning("Connection closed (likely interruption): %s", e)
                         break
-                    logger.exception(f"Response error: {e}", extra={"session_id": session_id})
+                    logger.exception("Response error: %s", e)
                     await asyncio.sleep(0.1)
                 
                 # Finally block removed as we are not toggling allow_interruption here anymore
 
         except asyncio.CancelledError:
-            pass
+            raise
         except Exception as e:
-            logger.exception(f"Fatal response error: {e}", extra={"session_id": session_id})
-        finally:
-            is_connected = False
+            logger.exception("Fatal response error: %s", e)
+        raise SessionClosedError("Gemini response stream ended")
 
     async def run_background_summary(context_from_live_session: str = ""):
         """Backend task to generate and inject summary asynchronously."""
         try:
-            logger.info("Starting background summary generation...", extra={"session_id": session_id})
+            logger.info("Starting background summary generation...")
             
             # Combine sourced transcripts. 
             # If we have live context, it's prioritized as it contains the "hearing" of the model.
             transcript_buffer = await state_manager.get_transcript()
             
-            full_transcript_context = f"""
-            [Live Model Memory (Speaker's Words)]:
-            {context_from_live_session}
-            
-            [System Log (AI Responses)]:
-            {transcript_buffer}
-            """
+            full_transcript_context = "".join((
+                "[Live Model Memory (Speaker's Words)]:\n",
+                context_from_live_session,
+                "\n\n[System Log (AI Responses)]:\n",
+                transcript_buffer,
+            ))
             
             slide_context = LATEST_SLIDE_SUMMARY or "No slide content available."
             
-            # Create a fresh processor instance
-            processor = ContentProcessor()
-            summary_text = await processor.generate_presentation_summary(full_transcript_context, slide_context)
+            summary_text = await content_processor.generate_presentation_summary(full_transcript_context, slide_context)
             
             if not summary_text or "Error" in summary_text:
-                logger.warning("Summary generation returned empty or error", extra={"session_id": session_id})
+                logger.warning("Summary generation returned empty or error")
                 return
 
             # Use slide_tools to format the injection payload
@@ -484,7 +832,7 @@ async def websocket_endpoint(
             
             if injection_result.get("success"):
                  html_content = injection_result.get("html", "")
-                 logger.info("Background summary ready, injecting...", extra={"session_id": session_id})
+                 logger.info("Background summary ready, injecting...")
                  
                  await safe_send_json({
                     "type": "inject_summary",
@@ -492,10 +840,34 @@ async def websocket_endpoint(
                     "summary": summary_text,
                 })
             else:
-                logger.error(f"Injection formatting failed: {injection_result.get('error')}", extra={"session_id": session_id})
+                logger.error("Injection formatting failed: %s", injection_result.get("error"))
 
         except Exception as e:
-            logger.error(f"Background summary task failed: {e}", extra={"session_id": session_id})
+            logger.error("Background summary task failed: %s", e)
+
+    def start_background_summary(context_from_live_session: str):
+        """Start a background summary unless one is already running for this session."""
+        nonlocal summary_task
+        if summary_task is not None and not summary_task.done():
+            logger.info("Summary already in progress, ignoring new request")
+            return
+        summary_task = asyncio.create_task(run_background_summary(context_from_live_session))
+
+    async def announce_function_call(fc) -> tuple[str, str, dict]:
+        """Announce a single function call to the frontend and return it as an executor call."""
+        name = fc.name
+        args = fc.args or {}
+
+        logger.info("Executing: %s(%s)", name, args)
+
+        # Notify frontend of detected intent
+        await safe_send_json({
+            "type": "intent_detected",
+            "tool": name,
+            "args": args,
+        })
+
+        return name, fc.id, args
 
     async def process_tool_calls(tool_call):
         """Process tool calls from Gemini."""
@@ -503,76 +875,62 @@ async def websocket_endpoint(
         allow_interruption.clear()
         
         try:
-            logger.info("Tool call detected", extra={"session_id": session_id})
-
-            function_responses = []
-            if hasattr(tool_call, "function_calls"):
-                for fc in tool_call.function_calls:
-                    name = fc.name
-                    args = dict(fc.args) if hasattr(fc, "args") and fc.args else {}
+            logger.info("Tool call detected")
 
-                    logger.info(f"Executing: {name}({json.dumps(args)})", extra={"session_id": session_id})
+            # Run independent calls concurrently; StateManager's lock keeps
+            # navigation calls applied in the order Gemini issued them
+            function_calls = tool_call.function_calls or []
+            calls = [await announce_function_call(fc) for fc in function_calls]
+            function_responses = await executor.execute_tools_batch(calls)
 
-                    # Notify frontend of detected intent
-                    await safe_send_json({
-                        "type": "intent_detected",
-                        "tool": name,
-                        "args": args,
-                    })
+            for fc, result in zip(function_calls, function_responses):
+                name = fc.name
+                args = fc.args or {}
 
-                    # Execute the tool
-                    result = await executor.execute_tool(name, fc.id, args)
-                    function_responses.append(result)
-
-                    # Send result to frontend
-                    try:
-                        res_data = result.response.get("data", {})
-                        status = result.response.get("status", "unknown")
-
-                        if name == "navigate_slide":
-                            current_slide = res_data.get("current_slide", 0)
-                            direction = args.get("direction", "unknown")
-
-                            logger.info(
-                                f"✓ {direction} -> Slide {current_slide + 1}", extra={"session_id": session_id}
-                            )
-
-                            await safe_send_json({
-                                "type": "slide_command",
-                                "action": direction,
-                                "slide_index": current_slide,
-                                "status": status,
-                            })
-                        elif name == "trigger_summary" or res_data.get("action") == "start_background_summary":
-                            logger.info(f"✓ Summary Triggered (Async)", extra={"session_id": session_id})
-                            
-                            # Extract context from tool args via the result data (since we passed it through)
-                            context = res_data.get("conversational_context", "")
-                            
-                            # Launch background task with the context
-                            asyncio.create_task(run_background_summary(context))
-                            
-                            await safe_send_json({
-                                "type": "tool_result",
-                                "tool": name,
-                                "status": status,
-                                "data": res_data,
-                            })
-                        else:
-                            logger.info(f"✓ {name}: {status}", extra={"session_id": session_id})
-                            await safe_send_json({
-                                "type": "tool_result",
-                                "tool": name,
-                                "status": status,
-                                "data": res_data,
-                            })
-                    except Exception as e:
-                        logger.warning(f"Error processing result: {e}", extra={"session_id": session_id})
+                # Send result to frontend
+                try:
+                    res_data = result.response.get("data", {})
+                    status = result.response.get("status", "unknown")
+
+                    if name == "navigate_slide":
+                        current_slide = res_data.get("current_slide", 0)
+                        direction = args.get("direction", "unknown")
+
+                        logger.info(
+                            "✓ %s -> Slide %s", direction, current_slide + 1
+                        )
+
+                        await send_slide_command(direction, current_slide, status)
+                    elif name == "trigger_summary" or res_data.get("action") == "start_background_summary":
+                        logger.info("✓ Summary Triggered (Async)")
+                        
+                        # Extract context from tool args via the result data (since we passed it through)
+                        context = res_data.get("conversational_context", "")
+                        
+                        # Launch background task with the context
+                        start_background_summary(context)
+                        
+                        await safe_send_json({
+                            "type": "tool_result",
+                            "tool": name,
+                            "status": status,
+                            "data": res_data,
+                        })
+                    else:
+                        logger.info("✓ %s: %s", name, status)
+                        await safe_send_json({
+                            "type": "tool_result",
+                            "tool": name,
+                            "status": status,
+                            "data": res_data,
+                        })
+                except Exception as e:
+                    logger.warning("Error processing result: %s", e)
 
             # Send tool responses back to Gemini
             if function_responses:
                 await session.send_tool_response(function_responses=function_responses)
-                logger.debug(f"Sent {len(function_responses)} tool response(s)", extra={"session_id": session_id})
+                logger.debug("Sent %s tool response(s)", len(function_responses))
         
         finally:
             # Resume audio transmission
@@ -582,14 +940,26 @@ async def websocket_endpoint(
     # Main Session Loop
     # -------------------------------------------------------------------------
 
+    # Everything after the checkout runs inside this try, so the finally
+    # always returns the processor to the pool
     try:
-        logger.info("Connecting to Gemini Live API...", extra={"session_id": session_id})
+        # Create session-scoped components
+        executor, state_manager, slide_tools = create_session_components()
+        await state_manager.set_session_id(session_id)
+
+        # Inject latest summary if available
+        gemini_config = create_gemini_config(executor, slide_summary=LATEST_SLIDE_SUMMARY)
+
+        # Start the pooled audio processor for this session
+        await audio_processor.start()
+
+        logger.info("Connecting to Gemini Live API...")
 
         async with client.aio.live.connect(
             model=config.LIVE_GEMINI_MODEL,
             config=gemini_config,
         ) as session:
-            logger.info("Connected to Gemini", extra={"session_id": session_id})
+            logger.info("Connected to Gemini")
 
             await safe_send_json({
                 "type": "status",
@@ -597,24 +967,31 @@ async def websocket_endpoint(
                 "message": "Voice control active",
             })
 
-            # Run all tasks concurrently
+            # Run all tasks concurrently; the first to raise cancels the rest
             async with asyncio.TaskGroup() as tg:
                 tg.create_task(receive_websocket_data())
+                tg.create_task(send_outbound())
+                tg.create_task(apply_slide_sync())
                 tg.create_task(forward_audio_to_gemini(session))
                 tg.create_task(handle_gemini_responses(session))
 
     except* WebSocketDisconnect:
-        logger.info("Client disconnected", extra={"session_id": session_id})
+        logger.info("Client disconnected")
+    except* SessionClosedError:
+        # The failing task has already logged why
+        pass
     except* Exception as eg:
         for exc in eg.exceptions:
-            logger.exception(f"Task error: {exc}", extra={"session_id": session_id})
+            logger.exception("Task error: %s", exc)
     finally:
-        is_connected = False
+        if summary_task is not None:
+            summary_task.cancel()
         await audio_processor.stop()
         
         logger.info(
-            f"Session ended ({audio_processor.chunk_count} audio chunks)", extra={"session_id": session_id}
+            "Session ended (%s audio chunks)", audio_processor.chunk_count
         )
+        audio_pool.put_nowait(audio_processor)
 
         try:
             await websocket.close()
@@ -628,6 +1005,27 @@ async def websocket_endpoint(
 
 
 if __name__ == "__main__":
+    import socket
+    import sys
+
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Bind the listening socket ourselves so accepted connections inherit its options.
+    # asyncio already sets TCP_NODELAY per connection; it is set here too for clarity,
+    # along with larger buffers for bursty audio
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+    sock.bind(("0.0.0.0", 8000))
+
+    # Pin the C-accelerated event loop and HTTP parser from uvicorn[standard] (uvloop
+    # is not available on Windows) rather than relying on auto-detection
+    server_config = uvicorn.Config(
+        app,
+        loop="uvloop" if sys.platform != "win32" else "auto",
+        http="httptools",
+        ws="websockets",
+    )
+    uvicorn.Server(server_config).run(sockets=[sock])
@@ -39,9 +39,22 @@ text_queue: asyncio.Queue[str] = asyncio.Queue()
 audio_queue_mic: asyncio.Queue[dict[str, bytes]] = asyncio.Queue(maxsize=5)
 audio_stream: pyaudio.Stream | None = None
 
+def enqueue_mic_audio(data: bytes):
+    """Queues a captured chunk, dropping it if the sender has fallen behind."""
+    try:
+        audio_queue_mic.put_nowait({"data": data, "mime_type": "audio/pcm"})
+    except asyncio.QueueFull:
+        pass
+
 async def listen_audio():
-    """Listens for audio and puts it into the mic audio queue."""
+    """Opens the mic in callback mode, feeding the mic audio queue from PyAudio's capture thread."""
     global audio_stream
+    loop = asyncio.get_running_loop()
+
+    def on_audio(in_data, frame_count, time_info, status):
+        loop.call_soon_threadsafe(enqueue_mic_audio, in_data)
+        return (None, pyaudio.paContinue)
+
     mic_info = pya.get_default_input_device_info()
     audio_stream = await asyncio.to_thread(
         pya.open,
@@ -51,11 +64,10 @@ async def listen_audio():
         input=True,
         input_device_index=mic_info["index"],
         frames_per_buffer=CHUNK_SIZE,
+        stream_callback=on_audio,
     )
-    kwargs = {"exception_on_overflow": False} if __debug__ else {}
-    while True:
-        data = await asyncio.to_thread(audio_stream.read, CHUNK_SIZE, **kwargs)
-        await audio_queue_mic.put({"data": data, "mime_type": "audio/pcm"})
+    # Capture runs on PyAudio's thread; keep this task alive until the session ends
+    await asyncio.Event().wait()
 
 async def send_realtime(session):
     """Sends audio from the mic audio queue to the GenAI session."""
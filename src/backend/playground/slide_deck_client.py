@@ -14,13 +14,22 @@ Allows interactive voice control of the simulated slide deck.
 import asyncio
 import os
 import sys
-import json
-from datetime import datetime
+import time
+from typing import Callable
+import orjson
 from google import genai
-from google.genai.types import FunctionDeclaration, Schema, Type
+from google.genai.types import (
+    FunctionDeclaration,
+    LiveConnectConfig,
+    Schema,
+    SessionResumptionConfig,
+    Tool,
+    Type,
+)
 
 # Import modular components
 from slidekick.audio_processor import AudioProcessor
+from slidekick.exceptions import is_connection_closed
 from slidekick.tool_executor import ToolExecutor
 from slidekick.state_manager import StateManager
 from slidekick.slide_tools import SlideTools
@@ -32,30 +41,44 @@ client = genai.Client(api_key=config.GEMINI_API_KEY)
 # Configuration
 MODEL = "gemini-2.5-flash-native-audio-preview-12-2025"
 SHOW_THINKING_LOGS = os.getenv("SHOW_THINKING_LOGS", "0").lower() in ("1", "true", "yes")
+VERBOSE = os.getenv("VERBOSE", "1").lower() in ("1", "true", "yes")
 EXECUTION_LOG = "execution.log"
 
+# Audio that piles up while a send is in flight goes out as one message of up to
+# ~160 ms (16 kHz, 16-bit mono)
+AUDIO_BATCH_MAX_BYTES = 5120
+
 # UI/Print helpers
-print_queue = asyncio.Queue()
+log_queue: asyncio.Queue[str] = asyncio.Queue()
 
-def log_to_file(message: str):
-    """Write a message to the execution log."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(EXECUTION_LOG, "a", encoding="utf-8") as f:
-        f.write(f"[{timestamp}] {message}\n")
+# Log timestamps have one-second resolution, so each second is formatted once
+_log_ts_second = -1
+_log_ts = ""
 
-async def safe_print(message: str, file=sys.stdout, flush: bool = True):
-    """Queue print message."""
-    await print_queue.put((message, file, flush))
+def log_timestamp() -> str:
+    """Return the current local time formatted for the execution log."""
+    global _log_ts_second, _log_ts
+    second = int(time.time())
+    if second != _log_ts_second:
+        _log_ts_second = second
+        _log_ts = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+    return _log_ts
 
-async def print_queue_consumer():
-    """Consume and print messages."""
-    try:
+def log_to_file(message: str):
+    """Queue a message for the execution log (written by `log_writer`)."""
+    log_queue.put_nowait(f"[{log_timestamp()}] {message}\n")
+
+async def log_writer():
+    """Append queued log lines through one open handle, flushing once the queue drains."""
+    with open(EXECUTION_LOG, "a", encoding="utf-8", buffering=1 << 16) as f:
         while True:
-            message, file, flush = await print_queue.get()
-            print(message, file=file, flush=flush)
-            print_queue.task_done()
-    except asyncio.CancelledError:
-        pass
+            f.write(await log_queue.get())
+            if log_queue.empty():
+                f.flush()
+
+async def safe_print(message: str, file=sys.stdout, flush: bool = True):
+    """Print a message (a single synchronous write, so lines never interleave)."""
+    print(message, file=file, flush=flush)
 
 # ============================================================================
 # Main Logic
@@ -80,19 +103,95 @@ RULES:
 - If unsure, do nothing (don't interrupt the flow).
 """
 
+# Tool schemas are static, so they are built once at import time
+NAVIGATE_SLIDE_DECLARATION = FunctionDeclaration(
+    name="navigate_slide",
+    description="Move to next/prev slide or jump to specific slide number.",
+    parameters=Schema(
+        type=Type.OBJECT,
+        properties={
+            "direction": Schema(
+                type=Type.STRING, 
+                enum=["next", "prev", "jump"],
+                description="Navigation direction: 'next', 'prev', or 'jump'"
+            ),
+            "index": Schema(
+                type=Type.INTEGER,
+                description="Target slide number (1-based, e.g. Slide 1 = 1). Required if direction is 'jump'."
+            )
+        },
+        required=["direction"]
+    )
+)
+
+GET_PRESENTATION_CONTEXT_DECLARATION = FunctionDeclaration(
+    name="get_presentation_context",
+    description="Get current slide index, total slides, and session context."
+)
+
+TRIGGER_SUMMARY_DECLARATION = FunctionDeclaration(
+    name="trigger_summary",
+    description="Trigger the background generation of a presentation summary.",
+    parameters=Schema(
+        type=Type.OBJECT,
+        properties={
+            "conversational_context": Schema(
+                type=Type.STRING,
+                description="A detailed summary of what the SPEAKER has said during the presentation so far. Be comprehensive.",
+            ),
+        },
+        required=["conversational_context"],
+    ),
+)
+
+# Built once from the static schemas above and reused for every connect
+GEMINI_CONFIG = LiveConnectConfig(
+    response_modalities=["AUDIO"],
+    system_instruction=SYSTEM_INSTRUCTION,
+    session_resumption=SessionResumptionConfig(),
+    tools=[Tool(function_declarations=[
+        NAVIGATE_SLIDE_DECLARATION,
+        GET_PRESENTATION_CONTEXT_DECLARATION,
+        TRIGGER_SUMMARY_DECLARATION,
+    ])],
+)
+
+# Dropped sessions (e.g. error 1011) are reconnected with exponential backoff,
+# resuming from the latest handle Gemini sent so the conversation carries over
+RECONNECT_BACKOFF_INITIAL = 0.5  # seconds
+RECONNECT_BACKOFF_MAX = 8.0  # seconds
+resume_handle: str | None = None
+
+# Pretty-printers for tool results, keyed by tool name: (result data, args) -> line
+RESULT_FORMATTERS: dict[str, Callable[[dict, dict], str]] = {
+    # Show human-readable slide numbers (1-based)
+    "navigate_slide": lambda data, args: (
+        f"  ✓ {args.get('direction', 'unknown')} -> Slide {data.get('current_slide', 0) + 1}"
+    ),
+    "get_presentation_context": lambda data, args: (
+        f"  ✓ Context: Slide {data.get('current_slide', 0) + 1}/{data.get('total_slides', 0)}"
+    ),
+    "trigger_summary": lambda data, args: "  ✓ Summary generation triggered",
+}
+
+def to_backend_index(direction: str, index: int | None) -> int | None:
+    """Convert a 1-based (User/LLM) jump index to the 0-based backend index."""
+    if direction == "jump" and index is not None:
+        return max(0, index - 1)
+    return index
+
 async def send_realtime(session, audio_processor: AudioProcessor):
     """Stream audio to Gemini."""
     try:
-        audio_queue = audio_processor.get_audio_queue()
         while True:
             try:
-                msg = await audio_queue.get()
+                msg = await audio_processor.get_audio_batch(AUDIO_BATCH_MAX_BYTES)
                 await session.send_realtime_input(audio=msg)
             except asyncio.CancelledError:
                 raise
             except Exception as e:
                 # If connection is closed/error 1011, stop trying to send
-                if "1011" in str(e) or "closed" in str(e).lower():
+                if is_connection_closed(e):
                     print(f"Connection closed (send_realtime): {e}", file=sys.stderr)
                     break
                 print(f"Error sending audio: {e}", file=sys.stderr)
@@ -102,63 +201,59 @@ async def send_realtime(session, audio_processor: AudioProcessor):
 
 async def handle_responses(session, tool_executor: ToolExecutor):
     """Handle Gemini responses and tool calls."""
+    global resume_handle
     try:
         while True:
             try:
                 turn = session.receive()
                 async for response in turn:
-                    if hasattr(response, 'tool_call') and response.tool_call:
+                    # Keep the latest resumption handle for reconnects
+                    if (update := response.session_resumption_update) and update.resumable and update.new_handle:
+                        resume_handle = update.new_handle
+
+                    if tool_call := response.tool_call:
                         await safe_print("\n[TOOL_CALL DETECTED]")
                         
-                        function_responses = []
-                        if hasattr(response.tool_call, 'function_calls'):
-                            for fc in response.tool_call.function_calls:
-                                name = fc.name
-                                args = dict(fc.args) if hasattr(fc, 'args') and fc.args else {}
-                                
-                                await safe_print(f"  > Executing: {name}({json.dumps(args)})")
-                                log_to_file(f"Executing: {name} args={args}")
-                                
-                                # Execute
-                                result = await tool_executor.execute_tool(name, fc.id, args)
-                                function_responses.append(result)
+                        function_calls = tool_call.function_calls or []
+                        calls = []
+                        for fc in function_calls:
+                            args = fc.args or {}
+                            if VERBOSE:
+                                await safe_print(f"  > Executing: {fc.name}({orjson.dumps(args).decode()})")
+                            log_to_file(f"Executing: {fc.name} args={args}")
+                            calls.append((fc.name, fc.id, args))
+                        
+                        # Execute all calls of this turn concurrently
+                        function_responses = await tool_executor.execute_tools_batch(calls)
+                        
+                        # Pretty print results
+                        for (name, _, args), result in zip(calls, function_responses):
+                            try:
+                                res_data = result.response.get("data", {})
+                                status = result.response.get("status", "unknown")
                                 
-                                # Pretty print result
-                                try:
-                                    res_data = result.response.get("data", {})
-                                    status = result.response.get("status", "unknown")
-                                    
-                                    if name == "navigate_slide":
-                                        # Show human-readable slide number (1-based)
-                                        slide_idx = res_data.get('current_slide', 0)
-                                        direction = args.get('direction', 'unknown')
-                                        await safe_print(f"  ✓ {direction} -> Slide {slide_idx + 1}")
-                                    elif name == "get_presentation_context":
-                                        current = res_data.get('current_slide', 0)
-                                        total = res_data.get('total_slides', 0)
-                                        await safe_print(f"  ✓ Context: Slide {current + 1}/{total}")
-                                    elif name == "trigger_summary":
-                                        await safe_print(f"  ✓ Summary generation triggered")
-                                    else:
-                                        await safe_print(f"  ✓ {name}: {status}")
-                                except Exception:
-                                    pass
+                                if formatter := RESULT_FORMATTERS.get(name):
+                                    await safe_print(formatter(res_data, args))
+                                else:
+                                    await safe_print(f"  ✓ {name}: {status}")
+                            except Exception:
+                                pass
 
                         if function_responses:
                             await session.send_tool_response(function_responses=function_responses)
 
                     # Thinking logs
-                    if SHOW_THINKING_LOGS and response.server_content and response.server_content.model_turn:
-                        for part in response.server_content.model_turn.parts:
-                            if hasattr(part, 'text') and part.text:
-                                text = part.text.strip()
-                                if text:
-                                    await safe_print(f"\n[THINKING] {text}")
+                    if SHOW_THINKING_LOGS and (server_content := response.server_content) and (
+                        model_turn := server_content.model_turn
+                    ):
+                        for part in model_turn.parts or ():
+                            if part.text and (text := part.text.strip()):
+                                await safe_print(f"\n[THINKING] {text}")
             except asyncio.CancelledError:
                 raise
             except Exception as e:
                 # If connection is closed/error 1011, stop trying to send
-                if "1011" in str(e) or "closed" in str(e).lower():
+                if is_connection_closed(e):
                     print(f"Connection closed (handle_responses): {e}", file=sys.stderr)
                     break 
                 print(f"Error in handle_responses: {e}", file=sys.stderr)
@@ -174,7 +269,10 @@ async def run():
     print("Initializing Agentic Slide Deck Client...")
     
     # 1. Initialize Components
-    audio = AudioProcessor.from_pyaudio()  # Use factory method for local microphone
+    # PyAudio device probing runs in a thread, overlapping the Gemini connect below
+    audio_task = asyncio.create_task(
+        AudioProcessor.from_pyaudio_async(silence_hangover_seconds=config.SILENCE_HANGOVER_SECONDS or None)
+    )
     state = StateManager(total_slides=10)  # Simulating 10 slides
     tools = SlideTools(state)
     executor = ToolExecutor(verbose=False)
@@ -182,94 +280,82 @@ async def run():
     # WRAPPER for 1-based indexing (LLM Friendly)
     async def navigate_slide_wrapper(direction: str, index: int | None = None):
         """Wrapper to convert 1-based LLM index to 0-based backend index."""
-        if direction == "jump" and index is not None:
-            # Convert 1-based (User/LLM) to 0-based (Backend)
-            backend_index = max(0, index - 1)
-            return await tools.navigate_slide(direction, backend_index)
-        return await tools.navigate_slide(direction, index)
+        return await tools.navigate_slide(direction, to_backend_index(direction, index))
 
     # 2. Register Tools with Schemas
+    executor.register_tool("navigate_slide", navigate_slide_wrapper, NAVIGATE_SLIDE_DECLARATION)
     executor.register_tool(
-        "navigate_slide", 
-        navigate_slide_wrapper,
-        FunctionDeclaration(
-            name="navigate_slide",
-            description="Move to next/prev slide or jump to specific slide number.",
-            parameters=Schema(
-                type=Type.OBJECT,
-                properties={
-                    "direction": Schema(
-                        type=Type.STRING, 
-                        enum=["next", "prev", "jump"],
-                        description="Navigation direction: 'next', 'prev', or 'jump'"
-                    ),
-                    "index": Schema(
-                        type=Type.INTEGER,
-                        description="Target slide number (1-based, e.g. Slide 1 = 1). Required if direction is 'jump'."
-                    )
-                },
-                required=["direction"]
-            )
-        )
-    )
-    
-    executor.register_tool(
-        "get_presentation_context", 
-        tools.get_presentation_context,
-        FunctionDeclaration(
-            name="get_presentation_context",
-            description="Get current slide index, total slides, and session context."
-        )
-    )
-    
-    executor.register_tool(
-        "trigger_summary",
-        tools.trigger_summary,
-        FunctionDeclaration(
-            name="trigger_summary",
-            description="Trigger the background generation of a presentation summary.",
-            parameters=Schema(
-                type=Type.OBJECT,
-                properties={
-                    "conversational_context": Schema(
-                        type=Type.STRING,
-                        description="A detailed summary of what the SPEAKER has said during the presentation so far. Be comprehensive.",
-                    ),
-                },
-                required=["conversational_context"],
-            ),
-        ),
+        "get_presentation_context", tools.get_presentation_context, GET_PRESENTATION_CONTEXT_DECLARATION
     )
+    executor.register_tool("trigger_summary", tools.trigger_summary, TRIGGER_SUMMARY_DECLARATION)
     
-    # 3. Configure Gemini
-    gemini_config = {
-        "response_modalities": ["AUDIO"],
-        "system_instruction": SYSTEM_INSTRUCTION,
-        "tools": [{"function_declarations": executor.tools}],
-    }
-    
-    # 4. Connect
-    async with client.aio.live.connect(model=MODEL, config=gemini_config) as session:
-        print("="*60)
-        print("🎤 Voice Control Active")
-        print("="*60)
-        print("Say commands like:")
-        print("  - 'Next slide'")
-        print("  - 'Jump to slide 5'")
-        print("  - 'What slide am I on?'")
-        print("  - 'Summarize this presentation'")
-        print("\n(Press Ctrl+C to quit)\n")
-        
-        await audio.start_capture()
-        
-        async with asyncio.TaskGroup() as tg:
-            tg.create_task(send_realtime(session, audio))
-            tg.create_task(handle_responses(session, executor))
-            tg.create_task(print_queue_consumer())
+    # 3. Connect (and reconnect whenever the session drops)
+    log_task = asyncio.create_task(log_writer())
+    audio = None
+    backoff = RECONNECT_BACKOFF_INITIAL
+    try:
+        while True:
+            live_config = GEMINI_CONFIG
+            if resume_handle:
+                live_config = GEMINI_CONFIG.model_copy(
+                    update={"session_resumption": SessionResumptionConfig(handle=resume_handle)}
+                )
+
+            try:
+                async with client.aio.live.connect(model=MODEL, config=live_config) as session:
+                    backoff = RECONNECT_BACKOFF_INITIAL
+
+                    if audio is None:
+                        print("="*60)
+                        print("🎤 Voice Control Active")
+                        print("="*60)
+                        print("Say commands like:")
+                        print("  - 'Next slide'")
+                        print("  - 'Jump to slide 5'")
+                        print("  - 'What slide am I on?'")
+                        print("  - 'Summarize this presentation'")
+                        print("\n(Press Ctrl+C to quit)\n")
+
+                        audio = await audio_task
+                        await audio.start_capture()
+                    else:
+                        print("Reconnected.")
+
+                    # Either task returning means the connection is gone. The
+                    # sender may be parked in get_audio_batch() while the silence
+                    # gate drops chunks, so it is cancelled rather than awaited
+                    tasks = {
+                        asyncio.create_task(send_realtime(session, audio)),
+                        asyncio.create_task(handle_responses(session, executor)),
+                    }
+                    try:
+                        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                    finally:
+                        for task in tasks:
+                            task.cancel()
+                        await asyncio.gather(*tasks, return_exceptions=True)
+            except Exception as e:
+                print(f"Connection failed: {e}", file=sys.stderr)
+
+            print(f"Session ended, reconnecting in {backoff:.1f}s...", file=sys.stderr)
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, RECONNECT_BACKOFF_MAX)
+    finally:
+        log_task.cancel()
+        if audio is not None:
+            await audio.stop_capture()
 
 def main():
+    # uvloop (installed with uvicorn[standard], except on Windows) schedules tasks
+    # and socket I/O in C
+    try:
+        import uvloop
+        runner = uvloop.run
+    except ImportError:
+        runner = asyncio.run
+
     try:
-        asyncio.run(run())
+        runner(run())
     except KeyboardInterrupt:
         print("\nStopped.")
 
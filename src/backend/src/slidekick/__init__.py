@@ -1,5 +1,6 @@
 from .audio_processor import (
     AudioProcessor,
+    AudioRingBuffer,
     AudioSourceType,
     PyAudioProcessor,
     WebSocketAudioProcessor,
@@ -10,6 +11,7 @@ from .slide_tools import SlideTools
 
 __all__ = [
     "AudioProcessor",
+    "AudioRingBuffer",
     "AudioSourceType",
     "PyAudioProcessor",
     "WebSocketAudioProcessor",
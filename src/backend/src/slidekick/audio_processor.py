@@ -7,13 +7,15 @@ and provides a unified interface for audio streaming.
 This module provides:
 - Unified audio processing for PyAudio and WebSocket sources
 - PCM audio format configuration (16kHz, 16-bit, Mono)
-- Queue-based audio streaming
+- Ring-buffer-based audio streaming
+- Optional silence gating to stop forwarding long stretches of silence
 - Lifecycle management (start/stop)
 - Factory methods for creating source-specific instances
 """
 
 import asyncio
 import logging
+from collections import deque
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Optional
@@ -21,12 +23,134 @@ from typing import Optional
 logger = logging.getLogger(__name__)
 
 
+def is_silent(data: bytes, threshold: int) -> bool:
+    """
+    Return True if no 16-bit PCM sample in data reaches threshold in magnitude.
+    
+    The samples are scanned by max()/min() over a memoryview in C, so checking
+    a chunk costs microseconds and copies nothing.
+    """
+    if len(data) % 2:
+        return False
+    samples = memoryview(data).cast("h")
+    return not samples or (max(samples) < threshold and min(samples) > -threshold)
+
+
 class AudioSourceType(Enum):
     """Enumeration of supported audio source types."""
     PYAUDIO = "pyaudio"
     WEBSOCKET = "websocket"
 
 
+class AudioRingBuffer:
+    """
+    Fixed-capacity FIFO of raw audio chunks for asyncio producers and consumers.
+    
+    Mirrors the subset of the asyncio.Queue interface the processors use, but
+    keeps chunks in a bounded deque guarded by two events, without the
+    Queue's task accounting, so queuing audio does not allocate a message
+    dict per chunk. Chunks are stored by reference; no bytes are copied.
+    """
+    
+    __slots__ = ("maxsize", "nbytes", "_chunks", "_readable", "_writable")
+    
+    def __init__(self, maxsize: int):
+        """
+        Initialize the ring buffer.
+        
+        Args:
+            maxsize: Number of slots (chunks) the buffer can hold
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.nbytes = 0  # Total size of the buffered chunks
+        self._chunks: deque[bytes] = deque(maxlen=maxsize)
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._writable.set()
+    
+    def qsize(self) -> int:
+        """Number of chunks currently buffered."""
+        return len(self._chunks)
+    
+    def empty(self) -> bool:
+        """Return True if no chunks are buffered."""
+        return not self._chunks
+    
+    def full(self) -> bool:
+        """Return True if every slot is occupied."""
+        return len(self._chunks) == self.maxsize
+    
+    def put_nowait(self, chunk: bytes) -> None:
+        """
+        Store a chunk in the next free slot.
+        
+        Raises:
+            asyncio.QueueFull: If every slot is occupied
+        """
+        chunks = self._chunks
+        if len(chunks) == self.maxsize:
+            raise asyncio.QueueFull
+        chunks.append(chunk)
+        self.nbytes += len(chunk)
+        self._readable.set()
+        if len(chunks) == self.maxsize:
+            self._writable.clear()
+    
+    def put_overwrite(self, chunk: bytes) -> bool:
+        """
+        Store a chunk, overwriting the oldest one if every slot is occupied.
+        
+        Returns:
+            True if the oldest chunk was dropped to make room
+        """
+        chunks = self._chunks
+        if len(chunks) < self.maxsize:
+            self.put_nowait(chunk)
+            return False
+        # The bounded deque drops the oldest chunk on append; account for it first
+        self.nbytes += len(chunk) - len(chunks[0])
+        chunks.append(chunk)
+        return True
+    
+    def get_nowait(self) -> bytes:
+        """
+        Remove and return the oldest chunk.
+        
+        Raises:
+            asyncio.QueueEmpty: If no chunks are buffered
+        """
+        chunks = self._chunks
+        if not chunks:
+            raise asyncio.QueueEmpty
+        chunk = chunks.popleft()
+        self.nbytes -= len(chunk)
+        self._writable.set()
+        if not chunks:
+            self._readable.clear()
+        return chunk
+    
+    def clear(self) -> None:
+        """Discard every buffered chunk at once."""
+        self._chunks.clear()
+        self.nbytes = 0
+        self._readable.clear()
+        self._writable.set()
+    
+    async def put(self, chunk: bytes) -> None:
+        """Store a chunk, waiting for a free slot if the buffer is full."""
+        while len(self._chunks) == self.maxsize:
+            await self._writable.wait()
+        self.put_nowait(chunk)
+    
+    async def get(self) -> bytes:
+        """Remove and return the oldest chunk, waiting if the buffer is empty."""
+        while not self._chunks:
+            await self._readable.wait()
+        return self.get_nowait()
+
+
 class AudioProcessor(ABC):
     """
     Abstract base class for audio processing.
@@ -41,43 +165,90 @@ class AudioProcessor(ABC):
     SAMPLE_WIDTH = 2     # 16-bit = 2 bytes
     CHUNK_SIZE = 1600    # ~100ms of audio at 16kHz
     MIME_TYPE = "audio/pcm"
+    SILENCE_THRESHOLD = 500  # Peak sample magnitude below which a chunk is silent
     
-    def __init__(self, queue_maxsize: int = 5):
+    def __init__(self, queue_maxsize: int = 5, silence_hangover_seconds: float | None = None):
         """
         Initialize the audio processor.
         
         Args:
             queue_maxsize: Maximum size of the audio queue (default: 5)
+            silence_hangover_seconds: Once this much continuous silence has been
+                forwarded, further silent chunks are skipped until sound returns.
+                It should exceed Gemini's end-of-speech silence so turns still
+                end. None forwards everything.
         """
-        self.audio_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_maxsize)
+        self.audio_queue = AudioRingBuffer(queue_maxsize)
         self._is_running = False
         self._source_type: AudioSourceType | None = None
+        self._silence_hangover_bytes = (
+            None if silence_hangover_seconds is None
+            else int(silence_hangover_seconds * self.SAMPLE_RATE * self.SAMPLE_WIDTH * self.CHANNELS)
+        )
+        self._silent_bytes = 0
+        self._skipped_silent_count = 0
     
     @classmethod
-    def from_pyaudio(cls, queue_maxsize: int = 5) -> "PyAudioProcessor":
+    def from_pyaudio(
+        cls, queue_maxsize: int = 5, silence_hangover_seconds: float | None = None
+    ) -> "PyAudioProcessor":
         """
         Create an AudioProcessor that captures from local microphone via PyAudio.
         
         Args:
             queue_maxsize: Maximum size of the audio queue
+            silence_hangover_seconds: Silence to forward before gating it (None = no gate)
             
         Returns:
             PyAudioProcessor instance
         """
-        return PyAudioProcessor(queue_maxsize=queue_maxsize)
+        return PyAudioProcessor(queue_maxsize=queue_maxsize, silence_hangover_seconds=silence_hangover_seconds)
     
     @classmethod
-    def from_websocket(cls, queue_maxsize: int = 100) -> "WebSocketAudioProcessor":
+    async def from_pyaudio_async(
+        cls, queue_maxsize: int = 5, silence_hangover_seconds: float | None = None
+    ) -> "PyAudioProcessor":
+        """
+        Create a PyAudioProcessor without blocking the event loop.
+        
+        PyAudio initialization probes the audio devices, which can take hundreds
+        of milliseconds, so it runs in a worker thread and can overlap other
+        startup work (e.g. connecting to Gemini).
+        
+        Args:
+            queue_maxsize: Maximum size of the audio queue
+            silence_hangover_seconds: Silence to forward before gating it (None = no gate)
+            
+        Returns:
+            PyAudioProcessor instance
+        """
+        return await asyncio.to_thread(
+            PyAudioProcessor, queue_maxsize=queue_maxsize, silence_hangover_seconds=silence_hangover_seconds
+        )
+    
+    @classmethod
+    def from_websocket(
+        cls,
+        queue_maxsize: int = 100,
+        max_buffer_seconds: float | None = None,
+        silence_hangover_seconds: float | None = None,
+    ) -> "WebSocketAudioProcessor":
         """
         Create an AudioProcessor that receives audio from a WebSocket connection.
         
         Args:
             queue_maxsize: Maximum size of the audio queue (larger default for network buffering)
+            max_buffer_seconds: Maximum duration of audio to buffer (None = slot limit only)
+            silence_hangover_seconds: Silence to forward before gating it (None = no gate)
             
         Returns:
             WebSocketAudioProcessor instance
         """
-        return WebSocketAudioProcessor(queue_maxsize=queue_maxsize)
+        return WebSocketAudioProcessor(
+            queue_maxsize=queue_maxsize,
+            max_buffer_seconds=max_buffer_seconds,
+            silence_hangover_seconds=silence_hangover_seconds,
+        )
     
     @abstractmethod
     async def start(self) -> None:
@@ -89,23 +260,71 @@ class AudioProcessor(ABC):
         """Stop the audio processor and clean up resources."""
         pass
     
-    def get_audio_queue(self) -> asyncio.Queue:
+    def get_audio_queue(self) -> AudioRingBuffer:
         """
-        Get the audio queue for consuming audio chunks.
+        Get the audio buffer for consuming raw audio chunks.
         
         Returns:
-            asyncio.Queue containing audio messages in Gemini Live API format
+            AudioRingBuffer containing raw PCM bytes (use get_audio() for
+            messages in Gemini Live API format)
         """
         return self.audio_queue
     
     async def get_audio(self) -> dict:
         """
-        Get the next audio chunk from the queue.
+        Get the next audio chunk from the buffer.
+        
+        Returns:
+            Audio message dict with 'data' and 'mime_type' keys
+        """
+        return self.package_audio(await self.audio_queue.get())
+    
+    async def get_audio_batch(self, max_bytes: int) -> dict:
+        """
+        Get the next audio chunk joined with any others already buffered.
+        
+        Waits for one chunk, then drains buffered chunks without waiting until
+        about max_bytes have been collected, so a backlog goes out as one message.
         
+        Args:
+            max_bytes: Stop draining once at least this many bytes are collected
+            
         Returns:
             Audio message dict with 'data' and 'mime_type' keys
         """
-        return await self.audio_queue.get()
+        chunk = await self.audio_queue.get()
+        
+        chunks = [chunk]
+        size = len(chunk)
+        while size < max_bytes and not self.audio_queue.empty():
+            chunk = self.audio_queue.get_nowait()
+            chunks.append(chunk)
+            size += len(chunk)
+        
+        return self.package_audio(chunks[0] if len(chunks) == 1 else b"".join(chunks))
+    
+    def _skip_silence(self, data: bytes) -> bool:
+        """
+        Return True if a chunk should be dropped by the silence gate.
+        
+        Silence is forwarded until the hangover is used up, so Gemini still
+        sees the pause that ends a turn; any sound resets the hangover.
+        """
+        if self._silence_hangover_bytes is None:
+            return False
+        if not is_silent(data, self.SILENCE_THRESHOLD):
+            self._silent_bytes = 0
+            return False
+        self._silent_bytes += len(data)
+        if self._silent_bytes <= self._silence_hangover_bytes:
+            return False
+        self._skipped_silent_count += 1
+        return True
+    
+    @property
+    def skipped_silent_count(self) -> int:
+        """Get the number of silent chunks the silence gate did not forward."""
+        return self._skipped_silent_count
     
     def package_audio(self, data: bytes) -> dict:
         """
@@ -141,16 +360,25 @@ class PyAudioProcessor(AudioProcessor):
     with microphone access.
     """
     
-    def __init__(self, queue_maxsize: int = 5):
+    # Chunk sizes (in samples) emitted after each start: the first chunk is
+    # ~20 ms so Gemini hears audio sooner, then sizes double up to CHUNK_SIZE
+    CHUNK_RAMP = (320, 640, 1280)
+    
+    def __init__(self, queue_maxsize: int = 5, silence_hangover_seconds: float | None = None):
         """
         Initialize the PyAudio processor.
         
         Args:
             queue_maxsize: Maximum size of the audio queue
+            silence_hangover_seconds: Silence to forward before gating it (None = no gate)
         """
-        super().__init__(queue_maxsize=queue_maxsize)
+        super().__init__(queue_maxsize=queue_maxsize, silence_hangover_seconds=silence_hangover_seconds)
         self._source_type = AudioSourceType.PYAUDIO
-        self._capture_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: list[bytes] = []  # Captured buffers not yet emitted as a chunk
+        self._pending_bytes = 0
+        self._chunk_sizes = self._chunk_byte_sizes()
+        self._chunk_bytes = next(self._chunk_sizes)
         
         # Lazy import pyaudio to avoid import errors when not used
         try:
@@ -170,8 +398,8 @@ class PyAudioProcessor(AudioProcessor):
         """
         Start capturing audio from the default microphone.
         
-        Creates an audio stream and begins capturing audio chunks,
-        placing them into the audio queue.
+        Opens the stream in callback mode: PortAudio delivers each chunk on its
+        own capture thread, which hands it to the audio queue via the event loop.
         
         Raises:
             RuntimeError: If PyAudio is not available
@@ -187,63 +415,69 @@ class PyAudioProcessor(AudioProcessor):
         try:
             # Get default input device
             mic_info = self.pya.get_default_input_device_info()
-            logger.info(f"Using microphone: {mic_info.get('name', 'Unknown')}")
+            logger.info("Using microphone: %s", mic_info.get("name", "Unknown"))
+            
+            self._loop = asyncio.get_running_loop()
+            
+            # Restart the chunk size ramp so audio after a restart arrives quickly too
+            self._silent_bytes = 0
+            self._pending = []
+            self._pending_bytes = 0
+            self._chunk_sizes = self._chunk_byte_sizes()
+            self._chunk_bytes = next(self._chunk_sizes)
             
-            # Open audio stream
-            self.audio_stream = await asyncio.to_thread(
-                self.pya.open,
+            # Open audio stream inline: with start=False PortAudio only sets up
+            # the device, which returns quickly. It delivers the smallest ramp
+            # size and larger chunks are assembled in the callback
+            self.audio_stream = self.pya.open(
                 format=self.FORMAT,
                 channels=self.CHANNELS,
                 rate=self.SAMPLE_RATE,
                 input=True,
                 input_device_index=mic_info["index"],
-                frames_per_buffer=self.CHUNK_SIZE,
+                frames_per_buffer=self.CHUNK_RAMP[0],
+                stream_callback=self._on_audio,
+                start=False,
             )
             
             self._is_running = True
-            
-            # Start the capture loop
-            self._capture_task = asyncio.create_task(self._capture_loop())
+            self.audio_stream.start_stream()
             logger.info("PyAudio capture started")
             
         except Exception as e:
-            logger.exception(f"Error setting up audio input: {e}")
+            logger.exception("Error setting up audio input: %s", e)
             raise
     
-    async def _capture_loop(self) -> None:
+    def _chunk_byte_sizes(self):
+        """Yield the byte size of each chunk to emit: the ramp, then CHUNK_SIZE forever."""
+        frame_bytes = self.SAMPLE_WIDTH * self.CHANNELS
+        for samples in self.CHUNK_RAMP:
+            yield samples * frame_bytes
+        while True:
+            yield self.CHUNK_SIZE * frame_bytes
+    
+    def _on_audio(self, in_data, frame_count, time_info, status):
         """
-        Internal loop that continuously captures audio chunks.
+        PortAudio stream callback, run on PortAudio's capture thread.
         
-        Runs until stop() is called.
+        Collects buffers until the current chunk size is reached, then queues
+        the chunk on the event loop; if the consumer has stalled, the oldest
+        chunk is dropped rather than holding up the device. The buffers
+        PortAudio hands over are joined once per chunk, or queued as-is when
+        a single buffer fills the chunk.
         """
-        # Suppress overflow exceptions in debug mode
-        kwargs = {"exception_on_overflow": False} if __debug__ else {}
-        
-        try:
-            while self._is_running:
-                try:
-                    # Read audio chunk from stream
-                    data = await asyncio.to_thread(
-                        self.audio_stream.read, 
-                        self.CHUNK_SIZE, 
-                        **kwargs
-                    )
-                    
-                    # Package for Gemini Live API format
-                    audio_msg = self.package_audio(data)
-                    
-                    # Put into queue for consumption
-                    await self.audio_queue.put(audio_msg)
-                    
-                except Exception as e:
-                    if self._is_running:  # Only log if not shutting down
-                        logger.error(f"Error reading audio: {e}")
-                        await asyncio.sleep(0.1)
-                    continue
-                    
-        except asyncio.CancelledError:
-            # Clean shutdown
-            pass
+        if self._is_running:
+            pending = self._pending
+            pending.append(in_data)
+            self._pending_bytes += len(in_data)
+            if self._pending_bytes >= self._chunk_bytes:
+                chunk = pending[0] if len(pending) == 1 else b"".join(pending)
+                pending.clear()
+                self._pending_bytes = 0
+                self._chunk_bytes = next(self._chunk_sizes)
+                if not self._skip_silence(chunk):
+                    self._loop.call_soon_threadsafe(self.audio_queue.put_overwrite, chunk)
+        return (None, self.pyaudio.paContinue)
     
     async def stop(self) -> None:
         """
@@ -253,27 +487,20 @@ class PyAudioProcessor(AudioProcessor):
         """
         self._is_running = False
         
-        # Cancel the capture task
-        if self._capture_task:
-            self._capture_task.cancel()
-            try:
-                await self._capture_task
-            except asyncio.CancelledError:
-                pass
-        
-        # Close audio stream
+        # Stop the callback thread and close the audio stream
         if self.audio_stream:
             try:
+                self.audio_stream.stop_stream()
                 self.audio_stream.close()
             except Exception as e:
-                logger.error(f"Error closing audio stream: {e}")
+                logger.error("Error closing audio stream: %s", e)
         
         # Terminate pyaudio
         if self.pya:
             try:
                 self.pya.terminate()
             except Exception as e:
-                logger.error(f"Error terminating pyaudio: {e}")
+                logger.error("Error terminating pyaudio: %s", e)
         
         logger.info("PyAudio capture stopped")
     
@@ -295,22 +522,40 @@ class WebSocketAudioProcessor(AudioProcessor):
     and streamed to the backend via WebSocket.
     """
     
-    def __init__(self, queue_maxsize: int = 100):
+    STATS_LOG_INTERVAL = 10.0  # Seconds between debug chunk-count logs
+    
+    def __init__(
+        self,
+        queue_maxsize: int = 100,
+        max_buffer_seconds: float | None = None,
+        silence_hangover_seconds: float | None = None,
+    ):
         """
         Initialize the WebSocket audio processor.
         
         Args:
             queue_maxsize: Maximum size of the audio queue (larger for network buffering)
+            max_buffer_seconds: Maximum duration of audio to buffer. Browser frame
+                sizes vary, so the slot limit alone does not bound latency; once
+                this much audio is queued, the oldest chunks are dropped.
+                None applies only the slot limit.
+            silence_hangover_seconds: Silence to forward before gating it (None = no gate)
         """
-        super().__init__(queue_maxsize=queue_maxsize)
+        super().__init__(queue_maxsize=queue_maxsize, silence_hangover_seconds=silence_hangover_seconds)
+        self._max_buffer_bytes = (
+            None if max_buffer_seconds is None
+            else int(max_buffer_seconds * self.SAMPLE_RATE * self.SAMPLE_WIDTH * self.CHANNELS)
+        )
         self._source_type = AudioSourceType.WEBSOCKET
         self._chunk_count = 0
+        self._dropped_count = 0
+        self._stats_task: Optional[asyncio.Task] = None
     
     async def start(self) -> None:
         """
         Start the WebSocket audio processor.
         
-        Unlike PyAudio, this doesn't start a capture loop since audio
+        Unlike PyAudio, this doesn't open a capture stream since audio
         is pushed from the WebSocket handler via push_audio().
         """
         if self._is_running:
@@ -319,6 +564,12 @@ class WebSocketAudioProcessor(AudioProcessor):
         
         self._is_running = True
         self._chunk_count = 0
+        self._dropped_count = 0
+        self._silent_bytes = 0
+        self._skipped_silent_count = 0
+        # Progress is logged on a timer rather than checked on every push
+        if logger.isEnabledFor(logging.DEBUG):
+            self._stats_task = asyncio.create_task(self._log_stats())
         logger.info("WebSocket audio processor started")
     
     async def stop(self) -> None:
@@ -329,14 +580,51 @@ class WebSocketAudioProcessor(AudioProcessor):
         """
         self._is_running = False
         
+        if self._stats_task:
+            self._stats_task.cancel()
+            self._stats_task = None
+        
         # Clear the queue
-        while not self.audio_queue.empty():
-            try:
-                self.audio_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+        self.audio_queue.clear()
         
-        logger.info(f"WebSocket audio processor stopped (processed {self._chunk_count} chunks)")
+        logger.info(
+            "WebSocket audio processor stopped (processed %s chunks, dropped %s, skipped %s silent)",
+            self._chunk_count,
+            self._dropped_count,
+            self._skipped_silent_count,
+        )
+
+    async def _log_stats(self) -> None:
+        """Log the chunk count every STATS_LOG_INTERVAL seconds while running."""
+        while self._is_running:
+            await asyncio.sleep(self.STATS_LOG_INTERVAL)
+            logger.debug("WebSocket audio chunks processed: %s", self._chunk_count)
+
+    def _enqueue(self, data: bytes) -> None:
+        """
+        Buffer an audio chunk without blocking, dropping the oldest chunk if full.
+
+        The bounded queue caps per-session buffering when the Gemini uplink is slow,
+        both in chunks and (if max_buffer_seconds is set) in duration.
+        """
+        if self._skip_silence(data):
+            return
+        
+        queue = self.audio_queue
+        dropped = 0
+        if self._max_buffer_bytes is not None:
+            while queue.nbytes + len(data) > self._max_buffer_bytes and not queue.empty():
+                queue.get_nowait()
+                dropped += 1
+        dropped += queue.put_overwrite(data)
+        
+        if dropped:
+            previous = self._dropped_count
+            self._dropped_count += dropped
+            # Warn on the 1st drop and every 100th after (101st, 201st, ...)
+            if (previous - 1) // 100 != (self._dropped_count - 1) // 100:
+                logger.warning("Audio queue overflow, dropping oldest (%s dropped so far)", self._dropped_count)
+        self._chunk_count += 1
     
     async def push_audio(self, data: bytes) -> bool:
         """
@@ -346,32 +634,19 @@ class WebSocketAudioProcessor(AudioProcessor):
             data: Raw PCM audio bytes from WebSocket
             
         Returns:
-            True if audio was queued successfully, False if processor is stopped or queue is full
+            True if audio was accepted, False if the processor is stopped
+            (a full queue drops its oldest chunk instead of rejecting audio)
         """
         if not self._is_running:
             return False
         
         try:
-            audio_msg = self.package_audio(data)
-            
-            # Use put_nowait to avoid blocking the WebSocket handler
-            # If queue is full, we drop the oldest chunk
-            if self.audio_queue.full():
-                try:
-                    self.audio_queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    pass
-            
-            await self.audio_queue.put(audio_msg)
-            self._chunk_count += 1
-            
-            if self._chunk_count % 100 == 0:
-                logger.debug(f"WebSocket audio chunks processed: {self._chunk_count}")
-            
+            # Never block the WebSocket handler; the oldest chunk is dropped if full
+            self._enqueue(data)
             return True
             
         except Exception as e:
-            logger.error(f"Error pushing audio to queue: {e}")
+            logger.error("Error pushing audio to queue: %s", e)
             return False
     
     def push_audio_sync(self, data: bytes) -> bool:
@@ -388,28 +663,19 @@ class WebSocketAudioProcessor(AudioProcessor):
             return False
         
         try:
-            audio_msg = self.package_audio(data)
-            
-            # Use put_nowait - drop oldest if full
-            if self.audio_queue.full():
-                try:
-                    self.audio_queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    pass
-            
-            self.audio_queue.put_nowait(audio_msg)
-            self._chunk_count += 1
-            
+            self._enqueue(data)
             return True
             
-        except asyncio.QueueFull:
-            logger.warning("Audio queue full, dropping chunk")
-            return False
         except Exception as e:
-            logger.error(f"Error pushing audio to queue: {e}")
+            logger.error("Error pushing audio to queue: %s", e)
             return False
     
     @property
     def chunk_count(self) -> int:
         """Get the number of audio chunks processed."""
         return self._chunk_count
+
+    @property
+    def dropped_count(self) -> int:
+        """Get the number of queued chunks dropped because the queue was full."""
+        return self._dropped_count
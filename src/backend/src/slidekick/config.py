@@ -1,6 +1,7 @@
 import logging
 import os
 import sys
+from contextvars import ContextVar
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -9,9 +10,11 @@ BASE_DIR = Path(__file__).cwd()
 ENV_PATH = BASE_DIR / ".env"
 
 
+# .env is optional when the environment already provides the API key (e.g. set
+# by a process manager or container runtime)
 if ENV_PATH.exists():
     load_dotenv(dotenv_path=ENV_PATH)
-else:
+elif "GEMINI_API_KEY" not in os.environ:
     raise FileNotFoundError(f"Environment file not found at {ENV_PATH}")
 
 """ Gemini Configuration """
@@ -46,6 +49,13 @@ CRITICAL RULES:
 VERBOSE_TOOL_LOGS = int(os.getenv("VERBOSE_TOOL_LOG", 1))
 
 
+""" Audio Configuration """
+
+# Seconds of continuous silence forwarded to Gemini before further silent audio
+# is held back until sound returns (0 = forward everything)
+SILENCE_HANGOVER_SECONDS = float(os.getenv("SILENCE_HANGOVER_SECONDS", 2.0))
+
+
 """ Static file/directory Configuration """
 
 PUBLIC_DIR = BASE_DIR / "public"
@@ -57,6 +67,16 @@ SLIDES_DIR = PUBLIC_DIR / "slides"
 
 USE_TEMP_DIR = bool(os.getenv("USE_TEMP_DIR", 0))
 
+
+""" Scheduling Configuration (Linux only) """
+
+# Comma-separated CPU ids to pin the server process to, e.g. "0,1" (empty = no pinning)
+CPU_AFFINITY = {int(cpu) for cpu in os.getenv("CPU_AFFINITY", "").split(",") if cpu.strip()}
+
+# Run the event loop thread under SCHED_FIFO (needs CAP_SYS_NICE)
+ENABLE_RT = int(os.getenv("ENABLE_RT", 0))
+RT_PRIORITY = int(os.getenv("RT_PRIORITY", 10))
+
 """ Logging Configuration """
 
 LOG_DIR = BASE_DIR / 'logs'
@@ -65,20 +85,19 @@ LOG_DIR.mkdir(parents=True, exist_ok=True)
 file_handler = logging.FileHandler(filename=LOG_DIR / 'slidekick.log')
 console_handler = logging.StreamHandler(sys.stderr)
 
-def make_record_with_extra():
-    original_make_record = logging.Logger.makeRecord
-
-    def makeRecord(self, *args, **kwargs):
-        EXTRA_INDEX = 8
-        args_ = list(args)
-        args_[EXTRA_INDEX] = args[EXTRA_INDEX] or {"session_id": "N/A"}
-        record = original_make_record(self, *args_, **kwargs)
+# Session of the task currently logging; set once per WebSocket connection and
+# inherited by every task it spawns, so log calls don't pass `extra` themselves
+SESSION_ID: ContextVar[int | str] = ContextVar("session_id", default="N/A")
 
-        return record
+_default_record_factory = logging.getLogRecordFactory()
 
-    return makeRecord
+def session_record_factory(*args, **kwargs):
+    """Create log records tagged with the current session id (`%(session_id)s`)."""
+    record = _default_record_factory(*args, **kwargs)
+    record.session_id = SESSION_ID.get()
+    return record
 
-logging.Logger.makeRecord = make_record_with_extra()
+logging.setLogRecordFactory(session_record_factory)
 
 logging.basicConfig(
     level=logging.DEBUG,
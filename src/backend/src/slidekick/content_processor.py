@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from pathlib import Path
 from google import genai
@@ -11,8 +12,12 @@ class ContentProcessor:
     Process slide content for AI consumption.
     """
     
-    def __init__(self):
-        self.client = genai.Client(api_key=config.GEMINI_API_KEY)
+    def __init__(self, client: genai.Client | None = None):
+        """
+        Args:
+            client: Gemini client to reuse; a new one is created if omitted.
+        """
+        self.client = client or genai.Client(api_key=config.GEMINI_API_KEY)
         self.model = config.STATIC_GEMINI_MODEL
 
     async def process_slides(self, file_path: Path) -> str:
@@ -26,11 +31,17 @@ class ContentProcessor:
             A string containing the technical summary of the slides.
         """
         try:
-            if not file_path.exists():
-                logger.error(f"Slides file not found: {file_path}")
+            # Read off the event loop; a missing file surfaces as FileNotFoundError
+            try:
+                content = await asyncio.to_thread(file_path.read_text, encoding="utf-8")
+            except FileNotFoundError:
+                logger.error("Slides file not found: %s", file_path)
                 return "Error: Slides file not found."
-
-            content = file_path.read_text(encoding="utf-8")
+            
+            # Nothing to summarize; skip the model round-trip
+            if not content.strip():
+                logger.info("Slides file is empty, skipping summary generation")
+                return "Empty slide deck."
             
             prompt = f"""
             Here is the markdown content of a presentation slide deck.
@@ -60,7 +71,7 @@ class ContentProcessor:
                 return "Error: Could not generate summary."
                 
         except Exception as e:
-            logger.error(f"Failed to process slides: {e}")
+            logger.error("Failed to process slides: %s", e)
             return f"Error generating slide summary: {str(e)}"
 
     async def generate_presentation_summary(self, transcript: str, slide_context: str) -> str:
@@ -100,5 +111,5 @@ class ContentProcessor:
             else:
                 return "Could not generate summary."
         except Exception as e:
-            logger.error(f"Failed to generate live summary: {e}")
+            logger.error("Failed to generate live summary: %s", e)
             return f"Error: {e}"
@@ -1,3 +1,9 @@
+import websockets
+from google.genai import errors as genai_errors
+
+# Range of WebSocket close codes (RFC 6455 standard codes plus the ranges
+# reserved for libraries and applications); HTTP API errors use codes below it
+WEBSOCKET_CLOSE_CODES = range(1000, 5000)
 
 
 class BaseSlidekickError(Exception):
@@ -10,4 +16,24 @@ class BaseSlidekickError(Exception):
 
 class ToolExecutorError(BaseSlidekickError):
     """Exception for tool executor errors."""
-    pass
\ No newline at end of file
+    pass
+
+
+class SessionClosedError(BaseSlidekickError):
+    """Raised by a WebSocket session task to end the session and cancel its siblings."""
+    pass
+
+
+def is_connection_closed(exc: BaseException) -> bool:
+    """
+    Return True if an exception means the Gemini Live connection is gone.
+
+    Sends fail with websockets' ConnectionClosed, and receives re-raise the close
+    as an APIError carrying the close code; anything else falls back to a single
+    scan of the message.
+    """
+    if isinstance(exc, websockets.ConnectionClosed):
+        return True
+    if isinstance(exc, genai_errors.APIError) and exc.code in WEBSOCKET_CLOSE_CODES:
+        return True
+    return "closed" in str(exc).lower()
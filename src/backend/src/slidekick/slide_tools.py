@@ -20,6 +20,14 @@ from slidekick.state_manager import StateManager
 
 logger = logging.getLogger(__name__)
 
+# Simple HTML formatting using a Reveal.js compatible structure
+SUMMARY_HTML_TEMPLATE = """
+            <h2>Presentation Summary</h2>
+            <div class="summary-content" style="text-align: left; font-size: 0.8em;">
+%s
+            </div>
+            """
+
 
 class SlideTools:
     """
@@ -54,10 +62,9 @@ class SlideTools:
             Dict with navigation result
         """
         try:
-            new_index = await self.state.navigate(direction, index)
-            total = await self.state.get_total_slides()
+            new_index, total = await self.state.navigate_with_total(direction, index)
             
-            logger.info(f"Navigate: {direction} -> slide {new_index + 1} of {total or '?'}")
+            logger.info("Navigate: %s -> slide %s of %s", direction, new_index + 1, total or "?")
             
             return {
                 "action": "navigate",
@@ -67,7 +74,7 @@ class SlideTools:
                 "success": True,
             }
         except Exception as e:
-            logger.error(f"Navigation failed: {e}")
+            logger.error("Navigation failed: %s", e)
             return {
                 "action": "navigate",
                 "success": False,
@@ -91,7 +98,7 @@ class SlideTools:
                 **context,
             }
         except Exception as e:
-            logger.error(f"Failed to get context: {e}")
+            logger.error("Failed to get context: %s", e)
             return {
                 "action": "get_context",
                 "success": False,
@@ -109,15 +116,9 @@ class SlideTools:
             Dict with injection command.
         """
         try:
-            logger.info(f"Injecting summary: {summary_text[:50]}...")
+            logger.info("Injecting summary: %s...", summary_text[:50])
             
-            # Simple HTML formatting using a Reveal.js compatible structure
-            html_content = f"""
-            <h2>Presentation Summary</h2>
-            <div class="summary-content" style="text-align: left; font-size: 0.8em;">
-{summary_text}
-            </div>
-            """
+            html_content = SUMMARY_HTML_TEMPLATE % summary_text
             
             return {
                 "action": "inject_summary",
@@ -126,7 +127,7 @@ class SlideTools:
                 "success": True
             }
         except Exception as e:
-            logger.error(f"Inject summary failed: {e}")
+            logger.error("Inject summary failed: %s", e)
             return {
                 "action": "inject_summary",
                 "success": False,
@@ -13,11 +13,15 @@ This module provides:
 
 import asyncio
 import logging
+from collections import deque
 from datetime import datetime
 from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Keep last 100 lines to avoid memory growing indefinitely in long sessions
+TRANSCRIPT_MAX_LINES = 100
+
 
 class StateManager:
     """
@@ -46,9 +50,9 @@ class StateManager:
             "started_at": datetime.now(),
             "session_id": None,
         }
-        self.transcript_history: list[str] = []
+        self.transcript_history: deque[str] = deque(maxlen=TRANSCRIPT_MAX_LINES)
         self._lock = asyncio.Lock()
-        logger.debug(f"StateManager initialized with {total_slides} slides")
+        logger.debug("StateManager initialized with %s slides", total_slides)
     
     async def navigate(self, direction: str, index: Optional[int] = None) -> int:
         """
@@ -61,6 +65,24 @@ class StateManager:
         Returns:
             New slide index
             
+        Raises:
+            ValueError: If navigation is invalid
+        """
+        new_index, _ = await self.navigate_with_total(direction, index)
+        return new_index
+    
+    async def navigate_with_total(
+        self, direction: str, index: Optional[int] = None
+    ) -> tuple[int, int]:
+        """
+        Navigate like navigate(), also returning the total slide count.
+        
+        Both values are read in the same locked section, so tool responses
+        need a single state call.
+        
+        Returns:
+            Tuple of (new slide index, total slides)
+            
         Raises:
             ValueError: If navigation is invalid
         """
@@ -87,8 +109,8 @@ class StateManager:
             old_index = self.current_slide
             self.current_slide = new_index
             
-            logger.debug(f"Navigation: {direction} from {old_index} to {new_index}")
-            return new_index
+            logger.debug("Navigation: %s from %s to %s", direction, old_index, new_index)
+            return new_index, self.total_slides
     
     async def set_current_slide(self, index: int) -> None:
         """
@@ -99,12 +121,11 @@ class StateManager:
         """
         async with self._lock:
             self.current_slide = max(0, index)
-            logger.debug(f"Current slide set to {self.current_slide}")
+            logger.debug("Current slide set to %s", self.current_slide)
     
     async def get_current_slide(self) -> int:
         """Get the current slide index."""
-        async with self._lock:
-            return self.current_slide
+        return self.current_slide
     
     async def set_total_slides(self, total: int) -> None:
         """
@@ -115,26 +136,27 @@ class StateManager:
         """
         async with self._lock:
             self.total_slides = max(0, total)
-            logger.info(f"Total slides set to {self.total_slides}")
+            logger.info("Total slides set to %s", self.total_slides)
     
     async def get_total_slides(self) -> int:
         """Get the total number of slides."""
-        async with self._lock:
-            return self.total_slides
+        return self.total_slides
     
     async def get_context(self) -> dict[str, Any]:
         """
         Get presentation context summary.
         
+        Reads without the lock: the lock only serializes state transitions,
+        and none of these reads can interleave with another coroutine.
+        
         Returns:
             Dict with current state information
         """
-        async with self._lock:
-            return {
-                "current_slide": self.current_slide,
-                "total_slides": self.total_slides,
-                "session_metadata": self.session_metadata.copy(),
-            }
+        return {
+            "current_slide": self.current_slide,
+            "total_slides": self.total_slides,
+            "session_metadata": self.session_metadata.copy(),
+        }
     
     async def set_session_id(self, session_id: Any) -> None:
         """Set the session ID."""
@@ -145,7 +167,7 @@ class StateManager:
         """Reset state to initial values."""
         async with self._lock:
             self.current_slide = 0
-            self.transcript_history = []
+            self.transcript_history.clear()
             self.session_metadata = {
                 "started_at": datetime.now(),
                 "session_id": None,
@@ -153,19 +175,14 @@ class StateManager:
             logger.debug("StateManager reset")
 
     async def add_transcript(self, text: str) -> None:
-        """Add a line of transcript to history."""
-        async with self._lock:
-            if not hasattr(self, 'transcript_history'):
-                self.transcript_history = []
-            self.transcript_history.append(text)
-            # Keep last 100 lines to avoid memory growing indefinitely if long session
-            if len(self.transcript_history) > 100:
-                self.transcript_history = self.transcript_history[-100:]
+        """
+        Add a line of transcript to history.
+
+        Called for every Gemini text part, so this appends without taking the
+        lock; the bounded deque drops the oldest line once 100 are held.
+        """
+        self.transcript_history.append(text)
 
     async def get_transcript(self) -> str:
         """Get full transcript as a single string."""
-        async with self._lock:
-            if not hasattr(self, 'transcript_history'):
-                return ""
-            return "\n".join(self.transcript_history)
-
+        return "\n".join(self.transcript_history)
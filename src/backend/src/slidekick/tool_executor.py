@@ -7,6 +7,7 @@ Extracted from intent_client.py for reusability across the application.
 This module provides:
 - Tool registration system with function declarations
 - Tool execution with error handling
+- Concurrent execution of the function calls in one Gemini turn
 - Function response generation for Gemini sessions
 """
 
@@ -16,8 +17,6 @@ from typing import Any, Callable
 
 from google.genai.types import FunctionDeclaration, FunctionResponse
 
-from slidekick.exceptions import ToolExecutorError
-
 logger = logging.getLogger(__name__)
 
 
@@ -38,12 +37,20 @@ class ToolExecutor:
         """
         self._tools: dict[str, Callable] = {}
         self.declarations: dict[str, FunctionDeclaration] = {}
+        self._tools_cache: list[FunctionDeclaration] | None = None
         self.verbose = verbose
 
     @property
     def tools(self) -> list[FunctionDeclaration]:
-        """List all registered tool declarations for Gemini API."""
-        return list(self.declarations.values())
+        """
+        List all registered tool declarations for Gemini API.
+
+        The list is built once and reused until another tool is registered;
+        callers should not modify it.
+        """
+        if self._tools_cache is None:
+            self._tools_cache = list(self.declarations.values())
+        return self._tools_cache
 
     def register_tool(self, name: str, func: Callable, declaration: FunctionDeclaration):
         """
@@ -65,9 +72,10 @@ class ToolExecutor:
 
         self._tools[name] = func
         self.declarations[name] = declaration
+        self._tools_cache = None
 
         if self.verbose:
-            logger.info(f"Registered tool: {name}")
+            logger.info("Registered tool: %s", name)
 
     def has_tool(self, name: str) -> bool:
         """
@@ -100,7 +108,7 @@ class ToolExecutor:
         """
         args = args or {}
 
-        if not self.has_tool(func_name):
+        if (func := self._tools.get(func_name)) is None:
             error_msg = (
                 f"Unknown tool function requested: '{func_name}' is not registered."
             )
@@ -116,13 +124,13 @@ class ToolExecutor:
 
         try:
             if self.verbose:
-                logger.info(f"Executing tool function: '{func_name}(args={args})'")
+                logger.info("Executing tool function: '%s(args=%s)'", func_name, args)
 
             # Call the function with unpacked args
-            result = await self._tools[func_name](**args)
+            result = await func(**args)
 
             if self.verbose:
-                logger.info(f"Tool function '{func_name}' completed successfully")
+                logger.info("Tool function '%s' completed successfully", func_name)
 
             return FunctionResponse(
                 id=func_id,
@@ -130,8 +138,8 @@ class ToolExecutor:
                 response={"status": "success", "data": result, "error": None},
             )
         except Exception as e:
+            # One message for both the log and the response
             error_msg = f"Error executing tool function '{func_name}': {e}"
-            task_err = ToolExecutorError(error_msg, e)
 
             if self.verbose:
                 logger.error(error_msg, exc_info=True)
@@ -139,5 +147,22 @@ class ToolExecutor:
             return FunctionResponse(
                 id=func_id,
                 name=func_name,
-                response={"status": "error", "error": str(task_err), "data": None},
+                response={"status": "error", "error": error_msg, "data": None},
             )
+
+    async def execute_tools_batch(
+        self,
+        calls: list[tuple[str, str, dict[str, Any] | None]],
+    ) -> list[FunctionResponse]:
+        """
+        Execute several tool calls concurrently, e.g. all function calls of one turn.
+
+        execute_tool never raises, so one failing call does not affect the others.
+
+        Args:
+            calls (list[tuple[str, str, dict[str, Any] | None]]): (func_name, func_id, args) per call
+
+        Returns:
+            list[FunctionResponse]: One response per call, in the order given
+        """
+        return list(await asyncio.gather(*(self.execute_tool(*call) for call in calls)))
@@ -8,14 +8,17 @@ Tests both PyAudioProcessor and WebSocketAudioProcessor:
 """
 
 import asyncio
+import logging
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
 
 from slidekick.audio_processor import (
     AudioProcessor,
+    AudioRingBuffer,
     AudioSourceType,
     PyAudioProcessor,
     WebSocketAudioProcessor,
+    is_silent,
 )
 
 
@@ -27,12 +30,14 @@ from slidekick.audio_processor import (
 @pytest.fixture
 def mock_pyaudio():
     """Mock pyaudio for testing without actual audio hardware."""
-    with patch.object(PyAudioProcessor, '__init__', lambda self, queue_maxsize=5: None):
+    with patch.object(PyAudioProcessor, '__init__', lambda self, queue_maxsize=5, silence_hangover_seconds=None: None):
         processor = object.__new__(PyAudioProcessor)
-        processor.audio_queue = asyncio.Queue(maxsize=5)
+        processor.audio_queue = AudioRingBuffer(5)
         processor._is_running = False
         processor._source_type = AudioSourceType.PYAUDIO
-        processor._capture_task = None
+        processor._loop = None
+        processor._silence_hangover_bytes = None
+        processor._skipped_silent_count = 0
         processor.MIME_TYPE = "audio/pcm"
         processor.SAMPLE_RATE = 16000
         processor.CHANNELS = 1
@@ -53,7 +58,6 @@ def mock_pyaudio():
         
         # Mock the audio stream
         mock_stream = Mock()
-        mock_stream.read = Mock(return_value=b'\x00\x01' * 1600)
         mock_stream.close = Mock()
         processor.pya.open.return_value = mock_stream
         processor.pya.terminate = Mock()
@@ -67,6 +71,107 @@ def websocket_processor():
     return WebSocketAudioProcessor(queue_maxsize=10)
 
 
+# =============================================================================
+# AudioRingBuffer Tests
+# =============================================================================
+
+
+class TestAudioRingBuffer:
+    """Tests for the AudioRingBuffer used by the processors."""
+    
+    def test_fifo_order_after_partial_drain(self):
+        """Test that chunks added after draining a full buffer come out behind the older ones."""
+        buffer = AudioRingBuffer(3)
+        for chunk in (b'a', b'b', b'c'):
+            buffer.put_nowait(chunk)
+        assert buffer.full()
+        assert buffer.get_nowait() == b'a'
+        assert buffer.get_nowait() == b'b'
+        
+        buffer.put_nowait(b'd')
+        buffer.put_nowait(b'e')
+        
+        assert [buffer.get_nowait() for _ in range(3)] == [b'c', b'd', b'e']
+        assert buffer.empty()
+    
+    def test_full_and_empty_raise(self):
+        """Test that the nowait methods raise the asyncio.Queue exceptions."""
+        buffer = AudioRingBuffer(1)
+        with pytest.raises(asyncio.QueueEmpty):
+            buffer.get_nowait()
+        
+        buffer.put_nowait(b'a')
+        with pytest.raises(asyncio.QueueFull):
+            buffer.put_nowait(b'b')
+    
+    def test_put_overwrite_drops_oldest(self):
+        """Test that put_overwrite evicts the oldest chunk only when full."""
+        buffer = AudioRingBuffer(2)
+        assert buffer.put_overwrite(b'a') is False
+        assert buffer.put_overwrite(b'b') is False
+        assert buffer.put_overwrite(b'c') is True
+        
+        assert buffer.full()
+        assert [buffer.get_nowait() for _ in range(2)] == [b'b', b'c']
+        assert buffer.empty()
+    
+    def test_nbytes_tracks_buffered_size(self):
+        """Test that nbytes follows puts, overwrites and gets."""
+        buffer = AudioRingBuffer(2)
+        buffer.put_nowait(b'ab')
+        buffer.put_nowait(b'cde')
+        assert buffer.nbytes == 5
+        
+        buffer.put_overwrite(b'f')
+        assert buffer.nbytes == 4
+        
+        buffer.get_nowait()
+        buffer.get_nowait()
+        assert buffer.nbytes == 0
+    
+    def test_clear(self):
+        """Test that clear() empties the buffer and frees every slot."""
+        buffer = AudioRingBuffer(2)
+        buffer.put_nowait(b'a')
+        buffer.put_nowait(b'b')
+        
+        buffer.clear()
+        
+        assert buffer.empty()
+        assert buffer.nbytes == 0
+        buffer.put_nowait(b'c')
+        assert buffer.get_nowait() == b'c'
+    
+    def test_invalid_maxsize(self):
+        """Test that a buffer needs at least one slot."""
+        with pytest.raises(ValueError):
+            AudioRingBuffer(0)
+    
+    @pytest.mark.asyncio
+    async def test_get_waits_for_put(self):
+        """Test that get() blocks until a chunk is available."""
+        buffer = AudioRingBuffer(2)
+        getter = asyncio.create_task(buffer.get())
+        await asyncio.sleep(0)
+        assert not getter.done()
+        
+        buffer.put_nowait(b'chunk')
+        assert await asyncio.wait_for(getter, timeout=1.0) == b'chunk'
+    
+    @pytest.mark.asyncio
+    async def test_put_waits_for_space(self):
+        """Test that put() blocks while the buffer is full."""
+        buffer = AudioRingBuffer(1)
+        buffer.put_nowait(b'first')
+        putter = asyncio.create_task(buffer.put(b'second'))
+        await asyncio.sleep(0)
+        assert not putter.done()
+        
+        assert buffer.get_nowait() == b'first'
+        await asyncio.wait_for(putter, timeout=1.0)
+        assert buffer.get_nowait() == b'second'
+
+
 # =============================================================================
 # Abstract Base Class Tests
 # =============================================================================
@@ -83,12 +188,32 @@ class TestAudioProcessorBase:
         assert AudioProcessor.CHUNK_SIZE == 1600
         assert AudioProcessor.MIME_TYPE == "audio/pcm"
     
+    def test_is_silent(self):
+        """Test the peak-amplitude silence check on 16-bit PCM."""
+        def pcm(*samples):
+            return b''.join(v.to_bytes(2, 'little', signed=True) for v in samples)
+        
+        assert is_silent(pcm(0, 10, -499, 499), 500)
+        assert not is_silent(pcm(0, 10, 500), 500)
+        assert not is_silent(pcm(0, -500), 500)
+        assert is_silent(b'', 500)
+        # Odd-length data is not 16-bit PCM, so it is never treated as silence
+        assert not is_silent(b'\x00\x00\x00', 500)
+    
     def test_factory_from_pyaudio(self):
         """Test factory method creates PyAudioProcessor."""
         with patch.object(PyAudioProcessor, '__init__', return_value=None):
             processor = AudioProcessor.from_pyaudio(queue_maxsize=5)
             assert isinstance(processor, PyAudioProcessor)
     
+    @pytest.mark.asyncio
+    async def test_factory_from_pyaudio_async(self):
+        """Test async factory method creates PyAudioProcessor off the event loop."""
+        with patch.object(PyAudioProcessor, '__init__', return_value=None) as init:
+            processor = await AudioProcessor.from_pyaudio_async(queue_maxsize=5)
+            assert isinstance(processor, PyAudioProcessor)
+            init.assert_called_once_with(queue_maxsize=5, silence_hangover_seconds=None)
+    
     def test_factory_from_websocket(self):
         """Test factory method creates WebSocketAudioProcessor."""
         processor = AudioProcessor.from_websocket(queue_maxsize=50)
@@ -119,7 +244,7 @@ class TestPyAudioProcessor:
         processor = mock_pyaudio
         
         queue = processor.get_audio_queue()
-        assert isinstance(queue, asyncio.Queue)
+        assert isinstance(queue, AudioRingBuffer)
         assert queue.maxsize == 5
     
     @pytest.mark.asyncio
@@ -133,6 +258,62 @@ class TestPyAudioProcessor:
         assert packaged["data"] == raw_data
         assert packaged["mime_type"] == "audio/pcm"
     
+    @pytest.mark.asyncio
+    async def test_start_opens_callback_stream(self, mock_pyaudio):
+        """Test that start() opens the stream in callback mode and starts it."""
+        processor = mock_pyaudio
+        
+        await processor.start()
+        
+        kwargs = processor.pya.open.call_args.kwargs
+        assert kwargs["stream_callback"] == processor._on_audio
+        assert kwargs["start"] is False
+        processor.pya.open.return_value.start_stream.assert_called_once()
+        assert processor.is_running
+        
+        await processor.stop()
+        processor.pya.open.return_value.stop_stream.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_callback_drops_oldest_when_full(self, mock_pyaudio):
+        """Test that the capture callback keeps the newest chunks when the queue is full."""
+        processor = mock_pyaudio
+        processor.CHUNK_RAMP = (1600,)  # Emit every full-size buffer as-is
+        await processor.start()
+        
+        # Called from PortAudio's thread in real use
+        for i in range(8):
+            result = await asyncio.to_thread(processor._on_audio, bytes([i]) * 3200, 1600, {}, 0)
+            assert result == (None, processor.pyaudio.paContinue)
+        await asyncio.sleep(0)
+        await processor.stop()
+        
+        queue = processor.get_audio_queue()
+        assert [queue.get_nowait()[0] for _ in range(queue.qsize())] == list(range(3, 8))
+    
+    @pytest.mark.asyncio
+    async def test_callback_ramps_chunk_size(self, mock_pyaudio):
+        """Test that chunks start at ~20 ms and double up to CHUNK_SIZE."""
+        processor = mock_pyaudio
+        await processor.start()
+        
+        assert processor.pya.open.call_args.kwargs["frames_per_buffer"] == 320
+        # 320-sample (640-byte) buffers, as PortAudio delivers them
+        for _ in range(1 + 2 + 4 + 5):
+            processor._on_audio(b'\x00' * 640, 320, {}, 0)
+        await asyncio.sleep(0)
+        
+        queue = processor.get_audio_queue()
+        assert [len(queue.get_nowait()) for _ in range(queue.qsize())] == [640, 1280, 2560, 3200]
+        
+        # A restart begins the ramp again
+        await processor.stop()
+        processor._is_running = False
+        await processor.start()
+        processor._on_audio(b'\x00' * 640, 320, {}, 0)
+        await asyncio.sleep(0)
+        assert len(queue.get_nowait()) == 640
+    
     @pytest.mark.asyncio
     async def test_start_capture_alias(self, mock_pyaudio):
         """Test that start_capture is an alias for start."""
@@ -209,10 +390,8 @@ class TestWebSocketAudioProcessor:
         assert not websocket_processor.audio_queue.empty()
         assert websocket_processor.chunk_count == 1
         
-        # Verify audio message format
-        audio_msg = await websocket_processor.audio_queue.get()
-        assert audio_msg["data"] == audio_data
-        assert audio_msg["mime_type"] == "audio/pcm"
+        # Raw bytes are buffered; get_audio() wraps them in the message format
+        assert websocket_processor.audio_queue.get_nowait() is audio_data
     
     @pytest.mark.asyncio
     async def test_push_audio_when_stopped(self, websocket_processor):
@@ -240,6 +419,71 @@ class TestWebSocketAudioProcessor:
         # Should still have 2 items, oldest dropped
         assert processor.audio_queue.qsize() == 2
         assert processor.chunk_count == 3
+
+    @pytest.mark.asyncio
+    async def test_push_audio_overflow_counts_drops(self, caplog):
+        """Test that dropped chunks are counted and the overflow is logged."""
+        processor = WebSocketAudioProcessor(queue_maxsize=1)
+        await processor.start()
+        
+        await processor.push_audio(b'chunk1')
+        await processor.push_audio(b'chunk2')
+        await processor.push_audio(b'chunk3')
+        
+        assert processor.dropped_count == 2
+        assert (await processor.get_audio())["data"] == b'chunk3'
+        assert "overflow" in caplog.text
+    
+    @pytest.mark.asyncio
+    async def test_stats_logged_periodically_at_debug(self, caplog):
+        """Test that the chunk count is logged on a timer when DEBUG is enabled."""
+        caplog.set_level(logging.DEBUG, logger="slidekick.audio_processor")
+        processor = WebSocketAudioProcessor(queue_maxsize=10)
+        processor.STATS_LOG_INTERVAL = 0.01
+        await processor.start()
+        
+        await processor.push_audio(b'chunk')
+        await asyncio.sleep(0.05)
+        assert "chunks processed: 1" in caplog.text
+        
+        await processor.stop()
+        assert processor._stats_task is None
+    
+    @pytest.mark.asyncio
+    async def test_push_audio_trims_to_max_duration(self):
+        """Test that the oldest chunks are dropped once max_buffer_seconds is exceeded."""
+        # 0.01 s at 16 kHz, 16-bit mono = 320 bytes
+        processor = WebSocketAudioProcessor(queue_maxsize=10, max_buffer_seconds=0.01)
+        await processor.start()
+        
+        await processor.push_audio(b'a' * 100)
+        await processor.push_audio(b'b' * 100)
+        await processor.push_audio(b'c' * 100)
+        assert processor.dropped_count == 0
+        
+        # One large chunk pushes out both older ones it does not fit beside
+        await processor.push_audio(b'd' * 200)
+        assert processor.dropped_count == 2
+        assert processor.get_audio_queue().nbytes == 300
+        assert (await processor.get_audio())["data"] == b'c' * 100
+        assert (await processor.get_audio())["data"] == b'd' * 200
+    
+    @pytest.mark.asyncio
+    async def test_silence_gate_skips_after_hangover(self):
+        """Test that silence is forwarded for the hangover, then skipped until sound returns."""
+        # 0.01 s at 16 kHz, 16-bit mono = 320 bytes of hangover
+        processor = WebSocketAudioProcessor(queue_maxsize=10, silence_hangover_seconds=0.01)
+        await processor.start()
+        silence = b'\x00\x00' * 128
+        speech = (3000).to_bytes(2, 'little', signed=True) * 128
+        
+        for frame in (silence, silence, silence, speech, silence):
+            await processor.push_audio(frame)
+        
+        # The 2nd and 3rd silent frames exceed the hangover; speech resets it
+        assert processor.skipped_silent_count == 2
+        queue = processor.get_audio_queue()
+        assert [queue.get_nowait() for _ in range(queue.qsize())] == [silence, speech, silence]
     
     def test_push_audio_sync(self, websocket_processor):
         """Test synchronous audio push."""
@@ -275,6 +519,19 @@ class TestWebSocketAudioProcessor:
         assert audio_msg["data"] == test_data
         assert audio_msg["mime_type"] == "audio/pcm"
     
+    @pytest.mark.asyncio
+    async def test_get_audio_batch_joins_buffered_chunks(self, websocket_processor):
+        """Test that buffered chunks are joined up to the byte cap."""
+        await websocket_processor.start()
+        for chunk in (b'aa', b'bb', b'cc', b'dd'):
+            await websocket_processor.push_audio(chunk)
+        
+        first = await websocket_processor.get_audio_batch(max_bytes=5)
+        second = await websocket_processor.get_audio_batch(max_bytes=5)
+        
+        assert first == {"data": b'aabbcc', "mime_type": "audio/pcm"}
+        assert second["data"] == b'dd'
+    
     @pytest.mark.asyncio
     async def test_stop_clears_queue(self, websocket_processor):
         """Test that stopping clears the audio queue."""
@@ -158,6 +158,12 @@ class TestSlideNavigation:
         # Should allow going beyond when total is unknown
         assert new_index == 6
 
+    @pytest.mark.asyncio
+    async def test_navigate_with_total(self, state_manager):
+        """Test that navigate_with_total returns the new index and total together."""
+        assert await state_manager.navigate_with_total("next") == (1, 10)
+        assert await state_manager.navigate_with_total("jump", index=100) == (9, 10)
+
 
 # =============================================================================
 # Total Slides Tests
@@ -236,6 +242,14 @@ class TestTranscript:
         transcript = await state_manager.get_transcript()
         assert transcript == ""
 
+    @pytest.mark.asyncio
+    async def test_add_transcript_does_not_wait_for_lock(self, state_manager):
+        """Test that adding transcript does not block on the state lock."""
+        async with state_manager._lock:
+            await asyncio.wait_for(state_manager.add_transcript("Held"), timeout=0.1)
+
+        assert await state_manager.get_transcript() == "Held"
+
 
 # =============================================================================
 # Context Tests
@@ -266,6 +280,15 @@ class TestContext:
         assert context["session_metadata"]["session_id"] == "test-session-123"
         assert "started_at" in context["session_metadata"]
 
+    @pytest.mark.asyncio
+    async def test_reads_do_not_wait_for_lock(self, state_manager):
+        """Test that pure reads do not block on the state lock."""
+        async with state_manager._lock:
+            context = await asyncio.wait_for(state_manager.get_context(), timeout=0.1)
+            total = await asyncio.wait_for(state_manager.get_total_slides(), timeout=0.1)
+
+        assert context["total_slides"] == total == 10
+
 
 # =============================================================================
 # Session Management Tests
@@ -282,7 +305,16 @@ class TestSessionManagement:
         
         context = await state_manager.get_context()
         assert context["session_metadata"]["session_id"] == "abc123"
-    
+
+    @pytest.mark.asyncio
+    async def test_context_metadata_is_a_copy(self, state_manager):
+        """Test that mutating returned metadata does not change later contexts."""
+        context = await state_manager.get_context()
+        context["session_metadata"]["session_id"] = "tampered"
+
+        context = await state_manager.get_context()
+        assert context["session_metadata"]["session_id"] is None
+
     @pytest.mark.asyncio
     async def test_reset(self, state_manager):
         """Test resetting all state."""
@@ -4,6 +4,7 @@ Unit tests for ToolExecutor
 Tests tool registration, execution, error handling, and response formatting.
 """
 
+import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock
 
@@ -175,6 +176,19 @@ class TestToolQueries:
         declarations = tool_executor.tools
         assert len(declarations) == 2
         assert all(isinstance(d, FunctionDeclaration) for d in declarations)
+    
+    @pytest.mark.asyncio
+    async def test_tools_property_cached_until_register(self, tool_executor, sample_tool):
+        """Test tools property reuses its list until a new tool is registered."""
+        async def tool1():
+            return "1"
+        
+        tools = tool_executor.tools
+        assert tool_executor.tools is tools
+        
+        tool_executor.register_tool("tool1", tool1, FunctionDeclaration(name="tool1", description="First"))
+        assert tool_executor.tools is not tools
+        assert [d.name for d in tool_executor.tools] == ["tool1"]
 
 
 # =============================================================================
@@ -356,6 +370,58 @@ class TestToolExecutionComplexArgs:
         assert response.response["data"] == "hello - world"
 
 
+# =============================================================================
+# Batch Execution Tests
+# =============================================================================
+
+
+class TestBatchExecution:
+    """Tests for executing several tool calls at once."""
+
+    @pytest.mark.asyncio
+    async def test_execute_tools_batch_runs_concurrently(self, tool_executor, sample_declaration):
+        """Test that batched calls overlap and keep their order."""
+        started = []
+        release = asyncio.Event()
+
+        async def slow_tool(name: str):
+            started.append(name)
+            await release.wait()
+            return name
+
+        tool_executor.register_tool("slow_tool", slow_tool, sample_declaration)
+
+        batch = asyncio.create_task(tool_executor.execute_tools_batch([
+            ("slow_tool", "id1", {"name": "a"}),
+            ("slow_tool", "id2", {"name": "b"}),
+        ]))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        # Both calls are in flight before either finishes
+        assert started == ["a", "b"]
+        release.set()
+
+        responses = await batch
+        assert [r.id for r in responses] == ["id1", "id2"]
+        assert [r.response["data"] for r in responses] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_execute_tools_batch_isolates_errors(self, tool_executor, sample_declaration):
+        """Test that an unknown tool does not fail the rest of the batch."""
+        async def ok_tool():
+            return "ok"
+
+        tool_executor.register_tool("ok_tool", ok_tool, sample_declaration)
+
+        responses = await tool_executor.execute_tools_batch([
+            ("missing_tool", "id1", None),
+            ("ok_tool", "id2", None),
+        ])
+
+        assert responses[0].response["status"] == "error"
+        assert responses[1].response["data"] == "ok"
+
+
 # =============================================================================
 # Verbose Mode Tests
 # =============================================================================
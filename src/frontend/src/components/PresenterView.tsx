@@ -180,6 +180,53 @@ export const PresenterView: React.FC<PresenterViewProps> = ({ slideUrl, onExit }
     }
   }, [getReveal]);
 
+  // Apply a single (possibly batched) backend message
+  const dispatchMessage = useCallback((message: WebSocketMessage) => {
+    switch (message.type) {
+      case 'batch':
+        message.messages.forEach(dispatchMessage);
+        break;
+
+      case 'status':
+        setStatusMessage(message.message);
+        break;
+
+      case 'intent_detected':
+        setDetectedIntent({ tool: message.tool, args: message.args });
+        setAiStatus('Executing command...');
+        break;
+
+      case 'slide_command':
+        navigateSlide(message.action, message.slide_index);
+        setAiStatus(`Navigated: ${message.action}`);
+        // Clear intent after delay
+        setTimeout(() => setDetectedIntent(null), 3000);
+        break;
+
+      case 'tool_result':
+        setAiStatus(`Tool complete: ${message.status}`);
+        setTimeout(() => setDetectedIntent(null), 3000);
+        break;
+
+      case 'transcript':
+        setTranscript(prev => [...prev.slice(-19), message.text]);
+        setAiStatus('Processing speech...');
+        break;
+
+      case 'inject_summary':
+        if ('html' in message) {
+          injectSummary(message.html);
+          setAiStatus('Summary Injected');
+          setIsGeneratingSummary(false);
+          setTimeout(() => setDetectedIntent(null), 5000);
+        }
+        break;
+
+      default:
+        console.log('Unknown message type:', message);
+    }
+  }, [navigateSlide, injectSummary]);
+
   // Handle WebSocket messages
   const handleWebSocketMessage = useCallback(async (event: MessageEvent) => {
     if (event.data instanceof Blob) {
@@ -188,52 +235,12 @@ export const PresenterView: React.FC<PresenterViewProps> = ({ slideUrl, onExit }
       playAudio(arrayBuffer);
     } else {
       try {
-        const message = JSON.parse(event.data) as WebSocketMessage;
-
-        switch (message.type) {
-          case 'status':
-            setStatusMessage(message.message);
-            break;
-
-          case 'intent_detected':
-            setDetectedIntent({ tool: message.tool, args: message.args });
-            setAiStatus('Executing command...');
-            break;
-
-          case 'slide_command':
-            navigateSlide(message.action, message.slide_index);
-            setAiStatus(`Navigated: ${message.action}`);
-            // Clear intent after delay
-            setTimeout(() => setDetectedIntent(null), 3000);
-            break;
-
-          case 'tool_result':
-            setAiStatus(`Tool complete: ${message.status}`);
-            setTimeout(() => setDetectedIntent(null), 3000);
-            break;
-
-          case 'transcript':
-            setTranscript(prev => [...prev.slice(-19), message.text]);
-            setAiStatus('Processing speech...');
-            break;
-
-          case 'inject_summary':
-            if ('html' in message) {
-              injectSummary(message.html);
-              setAiStatus('Summary Injected');
-              setIsGeneratingSummary(false);
-              setTimeout(() => setDetectedIntent(null), 5000);
-            }
-            break;
-
-          default:
-            console.log('Unknown message type:', message);
-        }
+        dispatchMessage(JSON.parse(event.data) as WebSocketMessage);
       } catch (e) {
         console.error('Error parsing message:', e);
       }
     }
-  }, [navigateSlide, injectSummary]);
+  }, [dispatchMessage]);
 
   // Play audio from Gemini
   const playAudio = (audioData: ArrayBuffer) => {
@@ -54,7 +54,14 @@ export interface InjectSummaryMessage {
   summary: string;
 }
 
+// Several of the above coalesced into one frame by the backend
+export interface BatchMessage {
+  type: 'batch';
+  messages: WebSocketMessage[];
+}
+
 export type WebSocketMessage =
+  | BatchMessage
   | StatusMessage
   | IntentDetectedMessage
   | SlideCommandMessage